@@ -5,7 +5,7 @@ Terakoya Invoice Automation Script.
 This script automates monthly invoice submission for Terakoya lessons.
 
 Usage:
-    python run_terakoya.py --month 2025-10 --password PASSWORD [--dry-run] [--headless]
+    python run_terakoya.py --month 2025-10 --password PASSWORD [--dry-run] [--headless] [--workers N]
 
 Examples:
     # Submit invoice for October 2025
@@ -17,6 +17,10 @@ Examples:
     # Run in headless mode
     python run_terakoya.py --month 2025-10 --password "your_password" --headless
 
+    # Add invoice items with 3 browsers in parallel (all log in to the same
+    # account; only if the site allows concurrent sessions)
+    python run_terakoya.py --month 2025-10 --password "your_password" --workers 3
+
     # Use password from environment variable
     export TERAKOYA_PASSWORD="your_password"
     python run_terakoya.py --month 2025-10
@@ -25,9 +29,12 @@ Examples:
 import sys
 import argparse
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from src.automation.browser import Browser
 from src.automation.browser_config import BrowserConfig
@@ -36,7 +43,7 @@ from src.models.lesson import LessonData
 from src.models.invoice import InvoiceResult, InvoiceSummary
 from src.utils.config import config, SecureString
 from src.utils.logger import setup_logger
-from src.utils.file_utils import save_json, save_csv
+from src.utils.file_utils import save_json, save_records_csv
 
 
 def parse_arguments():
@@ -75,6 +82,18 @@ def parse_arguments():
         help="Terakoya login password (overrides TERAKOYA_PASSWORD env var)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of browsers adding invoice items in parallel (default: 1). "
+            "Each browser logs in to the same account; saves to the invoice are "
+            "serialized, but if the site allows only one session per account, "
+            "extra workers may log each other out - keep 1 unless verified"
+        )
+    )
+
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -160,6 +179,108 @@ def confirm_submission() -> bool:
     return response in ['y', 'yes']
 
 
+def create_worker_client(
+    browser_config: BrowserConfig,
+    password: SecureString,
+    year: int,
+    month: int,
+    save_lock: threading.Lock,
+    logger: logging.Logger
+) -> Optional[TerakoyaClient]:
+    """
+    Start an additional logged-in browser for parallel invoice item entry.
+
+    The worker logs in to the same account as the main client. Saves are
+    serialized through save_lock, but form filling runs concurrently.
+
+    Args:
+        browser_config: Browser configuration
+        password: Terakoya login password
+        year: Target year
+        month: Target month
+        save_lock: Lock shared by all clients writing to this invoice
+        logger: Logger instance
+
+    Returns:
+        TerakoyaClient on the invoice page, or None if setup failed
+        (the run continues with fewer workers)
+    """
+    try:
+        browser = Browser(config=browser_config)
+    except Exception as e:
+        logger.warning(f"Worker browser failed to initialize: {e}")
+        return None
+
+    try:
+        client = TerakoyaClient(
+            browser=browser,
+            base_url=config.terakoya_url,
+            save_lock=save_lock
+        )
+
+        login_result = client.login(email=config.terakoya_email, password=password)
+        if login_result.is_failure:
+            logger.warning(f"Worker login failed: {login_result.message}")
+            browser.close()
+            return None
+
+        nav_result = client.navigate_to_invoice_page(year, month)
+        if nav_result.is_failure:
+            logger.warning(f"Worker navigation failed: {nav_result.message}")
+            browser.close()
+            return None
+
+        return client
+
+    except Exception as e:
+        logger.warning(f"Worker setup failed: {e}")
+        browser.close()
+        return None
+
+
+def record_add_result(
+    lesson: LessonData,
+    add_result,
+    dry_run: bool,
+    added_lessons: List[LessonData],
+    failed_lessons: List[tuple],
+    logger: logging.Logger
+):
+    """
+    Record and print the outcome of adding one invoice item.
+
+    Args:
+        lesson: Lesson that was added
+        add_result: Result returned by add_invoice_item_with_retry
+        dry_run: Whether this was a dry run
+        added_lessons: Successfully added lessons (appended to)
+        failed_lessons: Failed lessons with error messages (appended to)
+        logger: Logger instance
+    """
+    if add_result.is_success:
+        added_lessons.append(lesson)
+        status = "✓ Form filled (not saved)" if dry_run else "✓ Added successfully"
+        print(f"      {status}")
+
+        # 専属レッスンの場合、自動追加された前後対応もレポートに含める
+        if lesson.get("category") == "専属レッスン":
+            support_lesson = {
+                "id": f"{lesson['id']}_support",
+                "date": lesson["date"],
+                "student_id": lesson["student_id"],
+                "student_name": lesson["student_name"],
+                "status": lesson["status"],
+                "duration": 30,
+                "category": "専属レッスン前後対応"
+            }
+            added_lessons.append(support_lesson)
+            print(f"      ✓ Auto-added: 専属レッスン前後対応 (30min)")
+    else:
+        failed_lessons.append((lesson, add_result.message))
+        print(f"      ✗ Failed: {add_result.message}")
+        logger.error(f"Failed to add lesson: {add_result.message}")
+
+
 def save_execution_report(
     year: int,
     month: int,
@@ -213,9 +334,8 @@ def save_execution_report(
 
     # Save CSV for added lessons
     if added:
-        import pandas as pd
         csv_path = output_dir / f"invoice_items_{year}{month:02d}_{timestamp}.csv"
-        save_csv(pd.DataFrame(added), csv_path)
+        save_records_csv(added, csv_path)
         print(f"Invoice items saved to: {csv_path}")
 
 
@@ -252,6 +372,7 @@ def main():
         # Initialize browser
         logger.info("Initializing browser")
         browser = Browser(config=browser_config)
+        worker_clients: List[TerakoyaClient] = []
 
         try:
             # Initialize Terakoya client
@@ -348,39 +469,81 @@ def main():
             mode_label = "DRY RUN - Testing" if args.dry_run else "Adding"
             print(f"\n[5/6] {mode_label} {len(to_add)} invoice items...")
 
-            for idx, lesson in enumerate(to_add, 1):
-                action = "Testing" if args.dry_run else "Adding"
-                print(f"  [{idx}/{len(to_add)}] {action}: {lesson['date']} - {lesson['student_name']}")
-
-                add_result = client.add_invoice_item_with_retry(
-                    lesson=lesson,
-                    unit_price=config.lesson_unit_price,
-                    max_retries=3,
-                    dry_run=args.dry_run
-                )
-
-                if add_result.is_success:
-                    added_lessons.append(lesson)
-                    status = "✓ Form filled (not saved)" if args.dry_run else "✓ Added successfully"
-                    print(f"      {status}")
-
-                    # 専属レッスンの場合、自動追加された前後対応もレポートに含める
-                    if lesson.get("category") == "専属レッスン":
-                        support_lesson = {
-                            "id": f"{lesson['id']}_support",
-                            "date": lesson["date"],
-                            "student_id": lesson["student_id"],
-                            "student_name": lesson["student_name"],
-                            "status": lesson["status"],
-                            "duration": 30,
-                            "category": "専属レッスン前後対応"
-                        }
-                        added_lessons.append(support_lesson)
-                        print(f"      ✓ Auto-added: 専属レッスン前後対応 (30min)")
-                else:
-                    failed_lessons.append((lesson, add_result.message))
-                    print(f"      ✗ Failed: {add_result.message}")
-                    logger.error(f"Failed to add lesson: {add_result.message}")
+            action = "Testing" if args.dry_run else "Adding"
+            num_workers = max(1, min(args.workers, len(to_add)))
+
+            if num_workers == 1:
+                for idx, lesson in enumerate(to_add, 1):
+                    print(f"  [{idx}/{len(to_add)}] {action}: {lesson['date']} - {lesson['student_name']}")
+
+                    add_result = client.add_invoice_item_with_retry(
+                        lesson=lesson,
+                        unit_price=config.lesson_unit_price,
+                        max_retries=3,
+                        dry_run=args.dry_run
+                    )
+
+                    record_add_result(
+                        lesson, add_result, args.dry_run,
+                        added_lessons, failed_lessons, logger
+                    )
+            else:
+                # Each worker owns its own browser session; lessons are
+                # dispatched to whichever client is idle. All clients write to
+                # the same invoice, so their saves share one lock.
+                save_lock = threading.Lock()
+                client.save_lock = save_lock
+
+                logger.info(f"Starting {num_workers - 1} additional browser(s)")
+                with ThreadPoolExecutor(
+                    max_workers=num_workers - 1, thread_name_prefix="worker-setup"
+                ) as executor:
+                    # Chrome launches lazily on login, so workers start in parallel
+                    startup_futures = [
+                        executor.submit(
+                            create_worker_client,
+                            browser_config, password, year, month, save_lock, logger
+                        )
+                        for _ in range(num_workers - 1)
+                    ]
+                    for future in startup_futures:
+                        worker_client = future.result()
+                        if worker_client is not None:
+                            worker_clients.append(worker_client)
+
+                idle_clients = queue.Queue()
+                for available_client in [client] + worker_clients:
+                    idle_clients.put(available_client)
+
+                def add_with_idle_client(lesson: LessonData):
+                    worker = idle_clients.get()
+                    try:
+                        return worker.add_invoice_item_with_retry(
+                            lesson=lesson,
+                            unit_price=config.lesson_unit_price,
+                            max_retries=3,
+                            dry_run=args.dry_run
+                        )
+                    finally:
+                        idle_clients.put(worker)
+
+                print(f"  Using {idle_clients.qsize()} browsers in parallel")
+
+                with ThreadPoolExecutor(
+                    max_workers=idle_clients.qsize(), thread_name_prefix="worker"
+                ) as executor:
+                    futures = [
+                        (idx, lesson, executor.submit(add_with_idle_client, lesson))
+                        for idx, lesson in enumerate(to_add, 1)
+                    ]
+
+                    # Record in input order so the report matches the serial path
+                    for idx, lesson, future in futures:
+                        print(f"  [{idx}/{len(to_add)}] {action}: {lesson['date']} - {lesson['student_name']}")
+                        record_add_result(
+                            lesson, future.result(), args.dry_run,
+                            added_lessons, failed_lessons, logger
+                        )
 
             summary = f"✓ Tested {len(added_lessons)} items (dry run)" if args.dry_run else f"✓ Added {len(added_lessons)} items"
             print(f"\n{summary}")
@@ -412,8 +575,10 @@ def main():
             return 0 if not failed_lessons else 1
 
         finally:
-            # Close browser
+            # Close browsers
             logger.info("Closing browser")
+            for worker_client in worker_clients:
+                worker_client.browser.close()
             browser.close()
 
     except KeyboardInterrupt:
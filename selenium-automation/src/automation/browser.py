@@ -8,14 +8,24 @@ This module provides a wrapper around Selenium WebDriver with:
 - Screenshot capabilities for debugging
 """
 
+import asyncio
+import base64
 import logging
+import os
+import re
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urldefrag
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
@@ -29,11 +39,345 @@ from webdriver_manager.chrome import ChromeDriverManager
 
 from .interfaces import WebBrowser
 from .browser_config import BrowserConfig
+from .browser_pool import default_pool
 from ..models.result import Result
 
 
 logger = logging.getLogger(__name__)
 
+# A batch_ops operation: (kind, by, value) or ("set_value", by, value, text)
+Op = Union[Tuple[str, str, str], Tuple[str, str, str, str]]
+
+# Set an input's value with a React-friendly JavaScript sequence.
+# Uses the native value setter so React's internal value tracker is updated.
+_SET_VALUE_SCRIPT = """
+    const element = arguments[0];
+    const value = arguments[1];
+    const lastValue = element.value;
+
+    const prototype = Object.getPrototypeOf(element);
+    const descriptor = Object.getOwnPropertyDescriptor(element, 'value')
+        || Object.getOwnPropertyDescriptor(prototype, 'value');
+    if (!descriptor || typeof descriptor.set !== 'function') {
+        throw new Error('Unable to locate native value setter');
+    }
+
+    descriptor.set.call(element, value);
+
+    const tracker = element._valueTracker;
+    if (tracker) {
+        tracker.setValue(lastValue);
+    }
+
+    element.dispatchEvent(new Event('input', { bubbles: true }));
+    element.dispatchEvent(new Event('change', { bubbles: true }));
+"""
+
+# _SET_VALUE_SCRIPT installed in every new document once fast input is first
+# used, so each later call only ships a one-line invocation. The global has a
+# random per-process name and is non-enumerable, so pages cannot pick it out
+# as an automation marker by name or by walking window's properties.
+_SET_VALUE_HELPER_NAME = "_" + secrets.token_hex(8)
+_SET_VALUE_HELPER_SOURCE = """
+    if (!Object.prototype.hasOwnProperty.call(window, '%(name)s')) {
+        Object.defineProperty(window, '%(name)s', {
+            value: function () {%(body)s},
+            enumerable: false
+        });
+    }
+""" % {"name": _SET_VALUE_HELPER_NAME, "body": _SET_VALUE_SCRIPT}
+
+# Returns false when the helper is missing (document loaded before install)
+_CALL_SET_VALUE_HELPER = """
+    const helper = window['%s'];
+    if (typeof helper !== 'function') {
+        return false;
+    }
+    helper(arguments[0], arguments[1]);
+    return true;
+""" % _SET_VALUE_HELPER_NAME
+
+# Document-wide XPath locators with an exact CSS equivalent:
+# //tag, //*[@id='x'], //tag[@class="x"][@type='y'], ...
+_SIMPLE_XPATH_RE = re.compile(
+    r"""^//(?P<tag>\*|[A-Za-z][A-Za-z0-9-]*)"""
+    r"""(?P<predicates>(?:\[@[A-Za-z_][A-Za-z0-9_-]*=(['"])[^'"\\]+\3\])*)$"""
+)
+_XPATH_ATTR_RE = re.compile(
+    r"""\[@(?P<attr>[A-Za-z_][A-Za-z0-9_-]*)=(['"])(?P<val>[^'"\\]+)\2\]"""
+)
+
+# Debug details for an element, matching WebElement.is_displayed/is_enabled/
+# location/size closely enough for logging
+_ELEMENT_DETAILS_SCRIPT = """
+    const element = arguments[0];
+    const rect = element.getBoundingClientRect();
+    return {
+        displayed: !!(element.offsetWidth || element.offsetHeight
+            || element.getClientRects().length),
+        enabled: !element.disabled,
+        location: {x: Math.round(rect.left + window.scrollX),
+                   y: Math.round(rect.top + window.scrollY)},
+        size: {width: rect.width, height: rect.height}
+    };
+"""
+
+# Resolve a list of CSS selectors with querySelector, polling every 100ms
+# until all of them match or the deadline (in ms) passes.
+_FIND_MANY_SCRIPT = """
+    const selectors = arguments[0];
+    const deadline = Date.now() + arguments[1];
+    const done = arguments[arguments.length - 1];
+
+    (function poll() {
+        const found = selectors.map(s => document.querySelector(s));
+        if (found.every(el => el !== null) || Date.now() >= deadline) {
+            done(found);
+            return;
+        }
+        setTimeout(poll, 100);
+    })();
+"""
+
+# Resolve once document.readyState reaches arguments[0] ("interactive" or
+# "complete"), then optionally once no resource has finished loading for
+# arguments[1] ms (a network-idle heuristic).
+_WAIT_FOR_READY_SCRIPT = """
+    const target = arguments[0];
+    const idleMs = arguments[1];
+    const done = arguments[arguments.length - 1];
+
+    const reached = () => target === 'interactive'
+        ? document.readyState !== 'loading'
+        : document.readyState === 'complete';
+
+    function afterReady() {
+        if (!idleMs) {
+            done();
+            return;
+        }
+        let timer = null;
+        const observer = new PerformanceObserver(() => {
+            clearTimeout(timer);
+            timer = setTimeout(finish, idleMs);
+        });
+        function finish() {
+            observer.disconnect();
+            done();
+        }
+        timer = setTimeout(finish, idleMs);
+        observer.observe({ type: 'resource' });
+    }
+
+    if (reached()) {
+        afterReady();
+        return;
+    }
+    document.addEventListener('readystatechange', function onChange() {
+        if (reached()) {
+            document.removeEventListener('readystatechange', onChange);
+            afterReady();
+        }
+    });
+"""
+
+# Clear the current origin's storage before a driver is pooled for reuse
+_CLEAR_STORAGE_SCRIPT = """
+    try {
+        window.localStorage.clear();
+        window.sessionStorage.clear();
+    } catch (e) {
+        // Opaque origins (about:blank, data:) have no storage
+    }
+"""
+
+# Quiet period for the "networkidle" wait strategy
+_NETWORK_IDLE_MS = 500
+
+# performance.timeOrigin is set per document, so it tells a freshly loaded
+# page from the previous one even when the URL is the same
+_DOCUMENT_IDENTITY_SCRIPT = "return [performance.timeOrigin, document.URL];"
+_TIME_ORIGIN_SCRIPT = "return performance.timeOrigin;"
+
+# Resolve with the first finished resource whose URL matches the pattern,
+# including ones that completed before the call (buffered entries).
+_WAIT_FOR_RESPONSE_SCRIPT = """
+    const pattern = new RegExp(arguments[0]);
+    const done = arguments[arguments.length - 1];
+
+    const toResult = entry => ({
+        url: entry.name,
+        status: entry.responseStatus || null,
+        initiator_type: entry.initiatorType,
+        duration_ms: entry.duration,
+        transfer_size: entry.transferSize
+    });
+
+    const observer = new PerformanceObserver(list => {
+        const match = list.getEntries().find(entry => pattern.test(entry.name));
+        if (match) {
+            observer.disconnect();
+            done(toResult(match));
+        }
+    });
+    observer.observe({ type: 'resource', buffered: true });
+"""
+
+# Run a list of {kind, by, value, text} operations in order within one call.
+# Stops at the first element that cannot be found and reports its index.
+_BATCH_OPS_SCRIPT = """
+    const ops = arguments[0];
+    const setValue = function () {""" + _SET_VALUE_SCRIPT + """};
+
+    const locate = op => {
+        switch (op.by) {
+            case 'xpath':
+                return document.evaluate(op.value, document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            case 'id':
+                return document.getElementById(op.value);
+            case 'name':
+                return document.getElementsByName(op.value)[0] || null;
+            case 'class name':
+                return document.getElementsByClassName(op.value)[0] || null;
+            case 'tag name':
+                return document.getElementsByTagName(op.value)[0] || null;
+            default:
+                return document.querySelector(op.value);
+        }
+    };
+
+    const results = [];
+    for (let i = 0; i < ops.length; i++) {
+        const op = ops[i];
+        const element = locate(op);
+        if (!element) {
+            return {results: results, failed: i};
+        }
+
+        if (op.kind === 'click') {
+            element.click();
+            results.push(null);
+        } else if (op.kind === 'set_value') {
+            setValue(element, op.text);
+            results.push(null);
+        } else {
+            results.push(element.innerText);
+        }
+    }
+    return {results: results, failed: null};
+"""
+
+# Operation kinds accepted by Browser.batch_ops
+_BATCH_OP_KINDS = ("click", "set_value", "get_text")
+
+# Locator strategies _BATCH_OPS_SCRIPT can resolve in the page
+_BATCH_LOCATOR_STRATEGIES = (
+    By.XPATH, By.ID, By.NAME, By.CLASS_NAME, By.TAG_NAME, By.CSS_SELECTOR
+)
+
+
+# Chrome has no content setting for stylesheets or fonts, so they are
+# blocked by URL at the network layer instead
+_CSS_URL_PATTERNS = ("*.css", "*.css?*")
+_FONT_URL_PATTERNS = (
+    "*.woff", "*.woff?*", "*.woff2", "*.woff2?*",
+    "*.ttf", "*.ttf?*", "*.otf", "*.otf?*", "*.eot", "*.eot?*",
+)
+
+
+@lru_cache(maxsize=256)
+def _xpath_to_css(xpath: str) -> Tuple[str, str]:
+    """
+    Convert a simple document-wide XPath to a CSS selector if exact.
+
+    Cached because the same locator strings are used over and over.
+
+    Args:
+        xpath: XPath expression
+
+    Returns:
+        (By.CSS_SELECTOR, selector) if convertible, else (By.XPATH, xpath)
+    """
+    match = _SIMPLE_XPATH_RE.match(xpath)
+    if match is None:
+        return By.XPATH, xpath
+
+    tag = match.group("tag")
+    selector = "" if tag == "*" else tag
+    for predicate in _XPATH_ATTR_RE.finditer(match.group("predicates")):
+        selector += f'[{predicate.group("attr")}="{predicate.group("val")}"]'
+
+    return By.CSS_SELECTOR, selector or "*"
+
+# File inside BrowserConfig.cache_dir holding the resolved ChromeDriver path
+_DRIVER_PATH_RECORD = "chromedriver_path"
+
+
+@lru_cache(maxsize=1)
+def _cached_chromedriver_path() -> str:
+    """
+    Install/locate ChromeDriver via webdriver-manager once per process.
+
+    install() checks its cache (and possibly the network) on every call.
+
+    Returns:
+        Path to the ChromeDriver binary
+    """
+    return ChromeDriverManager().install()
+
+
+def _blocked_url_patterns(config: BrowserConfig) -> List[str]:
+    """
+    Collect URL patterns to block via CDP Network.setBlockedURLs.
+
+    Args:
+        config: Browser configuration
+
+    Returns:
+        Patterns from blocked_url_patterns plus the block_css/block_fonts presets
+    """
+    patterns = list(config.blocked_url_patterns)
+
+    if config.block_css:
+        patterns.extend(_CSS_URL_PATTERNS)
+
+    if config.block_fonts:
+        patterns.extend(_FONT_URL_PATTERNS)
+
+    return patterns
+
+
+def _build_options(config: BrowserConfig) -> Options:
+    """
+    Build a fresh Chrome Options instance for the given configuration.
+
+    Arguments and prefs come precomputed from the config; only the Options
+    shell is rebuilt, since Selenium mutates the instance it is given.
+
+    Args:
+        config: Browser configuration
+
+    Returns:
+        Chrome Options ready to pass to webdriver.Chrome
+    """
+    options = Options()
+    options.page_load_strategy = config.page_load_strategy
+
+    for argument in config.chrome_args:
+        options.add_argument(argument)
+
+    # Disable automation flags if requested
+    if config.disable_automation_flags:
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("useAutomationExtension", False)
+
+    prefs = config.chrome_prefs
+    if prefs:
+        options.add_experimental_option("prefs", prefs)
+
+    return options
+
 
 class Browser(WebBrowser):
     """
@@ -69,6 +413,9 @@ class Browser(WebBrowser):
         """
         Initialize Browser instance.
 
+        Chrome is not launched here; it starts on the first operation
+        that needs the driver.
+
         Args:
             config: Browser configuration (recommended). If provided,
                    headless and download_dir are ignored.
@@ -77,9 +424,6 @@ class Browser(WebBrowser):
             download_dir: Custom download directory (default: None).
                          Only used if config is None.
 
-        Raises:
-            WebDriverException: If ChromeDriver initialization fails
-
         Examples:
             >>> # Using BrowserConfig (recommended)
             >>> config = BrowserConfig(headless=True, timeout=60)
@@ -99,78 +443,489 @@ class Browser(WebBrowser):
             )
 
         self.config = config
-        self.driver = None
+        self._driver = None
+        self._driver_lock = threading.Lock()
+        self._wait_cache: Dict[Tuple[int, float], WebDriverWait] = {}
+        self._script_timeout: Optional[int] = None
+        self._select_all_keys: Optional[str] = None
+        self._set_value_helper_installed = False
+        self._known_dirs: Set[Path] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def driver(self) -> webdriver.Chrome:
+        """
+        Underlying ChromeDriver, started on first access.
+
+        Raises:
+            WebDriverException: If ChromeDriver initialization fails
+        """
+        if self._driver is None:
+            self._ensure_driver()
+        return self._driver
+
+    def start(self) -> Result[None]:
+        """
+        Launch Chrome now instead of on the first operation.
+
+        Useful to fail fast on a missing driver, or to warm up browsers
+        on worker threads before handing them work.
 
+        Returns:
+            Result indicating success or failure
+
+        Examples:
+            >>> browser = Browser(config=BrowserConfig(headless=True))
+            >>> if browser.start().is_failure:
+            ...     sys.exit(1)
+        """
         try:
-            # Configure Chrome options
-            options = Options()
-
-            if config.headless:
-                options.add_argument("--headless")
-                options.add_argument("--disable-gpu")
-
-            # Set window size
-            width, height = config.window_size
-            options.add_argument(f"--window-size={width},{height}")
-
-            # Disable automation flags if requested
-            if config.disable_automation_flags:
-                options.add_argument("--disable-blink-features=AutomationControlled")
-                options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                options.add_experimental_option("useAutomationExtension", False)
-
-            # Set custom user agent if provided
-            if config.user_agent:
-                options.add_argument(f"--user-agent={config.user_agent}")
-
-            # Custom download directory
-            if config.download_dir:
-                prefs = {
-                    "download.default_directory": str(Path(config.download_dir).absolute()),
-                    "download.prompt_for_download": False,
-                }
-                options.add_experimental_option("prefs", prefs)
-
-            # Initialize ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-
-            logger.info(
-                f"Browser initialized (headless={config.headless}, "
-                f"window_size={config.window_size}, timeout={config.timeout})"
-            )
+            self._ensure_driver()
+            return Result.success(None, "Browser started")
 
-        except Exception as e:
-            logger.error(f"Failed to initialize browser: {e}", exc_info=True)
-            # Clean up any partially initialized driver
-            self.close()
-            raise WebDriverException(f"Browser initialization failed: {e}")
+        except WebDriverException as e:
+            return Result.failure("Browser failed to start", e)
+
+    def _ensure_driver(self) -> None:
+        """
+        Start Chrome if it is not running yet.
+
+        Chrome takes 1-2s to launch, so it is deferred until the first
+        operation. This lets callers create several Browser instances up
+        front and have them start in parallel on worker threads.
+
+        Raises:
+            WebDriverException: If ChromeDriver initialization fails
+        """
+        with self._driver_lock:
+            if self._driver is not None:
+                return
+
+            config = self.config
+
+            if config.reuse:
+                self._driver = default_pool.acquire(config)
+                if self._driver is not None:
+                    return
+
+            try:
+                options = _build_options(config)
+
+                # Initialize ChromeDriver
+                service = Service(self._resolve_driver_path())
+                self._driver = webdriver.Chrome(service=service, options=options)
+                self._enlarge_connection_pool(config.pool_size)
+
+                # Block stylesheets, fonts, trackers, etc. at the network layer
+                blocked_urls = _blocked_url_patterns(config)
+                if blocked_urls:
+                    self._driver.execute_cdp_cmd("Network.enable", {})
+                    self._driver.execute_cdp_cmd(
+                        "Network.setBlockedURLs",
+                        {"urls": blocked_urls}
+                    )
+
+                logger.info(
+                    "Browser initialized (headless=%s, window_size=%s, timeout=%s)",
+                    config.headless, config.window_size, config.timeout
+                )
+
+            except Exception as e:
+                logger.error("Failed to initialize browser: %r", e)
+                # Clean up any partially initialized driver
+                if self._driver:
+                    try:
+                        self._driver.quit()
+                    except Exception:
+                        pass
+                    self._driver = None
+                raise WebDriverException(f"Browser initialization failed: {e}")
+
+    def _resolve_driver_path(self) -> str:
+        """
+        Resolve the ChromeDriver binary path.
+
+        Order: config.driver_path, the CHROMEDRIVER_PATH environment
+        variable, the path remembered in config.cache_dir by a previous
+        run, then webdriver-manager (resolved once per process).
+
+        Returns:
+            Path to the ChromeDriver binary
+        """
+        if self.config.driver_path:
+            return self.config.driver_path
+
+        env_path = os.environ.get("CHROMEDRIVER_PATH")
+        if env_path:
+            return env_path
+
+        if not self.config.cache_dir:
+            return _cached_chromedriver_path()
+
+        record = Path(self.config.cache_dir) / _DRIVER_PATH_RECORD
+        try:
+            remembered = record.read_text(encoding="utf-8").strip()
+            if remembered and Path(remembered).is_file():
+                return remembered
+        except OSError:
+            pass
+
+        driver_path = _cached_chromedriver_path()
+        try:
+            record.parent.mkdir(parents=True, exist_ok=True)
+            record.write_text(driver_path, encoding="utf-8")
+        except OSError as e:
+            logger.warning("Could not persist ChromeDriver path to %s: %s", record, e)
+
+        return driver_path
+
+    @staticmethod
+    def invalidate_driver_cache() -> None:
+        """
+        Forget the ChromeDriver path resolved by webdriver-manager.
+
+        The next browser start calls webdriver-manager again, e.g. after
+        Chrome was upgraded in a long-running CI worker. A path remembered
+        in config.cache_dir is used until its binary disappears; delete the
+        record file to force a new lookup.
+        """
+        _cached_chromedriver_path.cache_clear()
+
+    def _enlarge_connection_pool(self, pool_size: int) -> None:
+        """
+        Rebuild the ChromeDriver HTTP pool with a larger maxsize.
+
+        Selenium's local Chrome connection uses a urllib3 PoolManager with
+        maxsize=1, so concurrent commands from several threads discard
+        keep-alive connections ("connection pool is full") and reconnect.
+
+        Args:
+            pool_size: Maximum number of pooled connections
+        """
+        executor = self._driver.command_executor
 
-    def navigate(self, url: str) -> Result[None]:
-        """Navigate to URL."""
         try:
-            logger.debug(f"Navigating to: {url}")
+            executor._client_config.init_args_for_pool_manager = {
+                "init_args_for_pool_manager": {"maxsize": pool_size}
+            }
+            if executor._client_config.keep_alive:
+                old_conn = executor._conn
+                executor._conn = executor._get_connection_manager()
+                old_conn.clear()
+
+        except AttributeError:
+            # Older Selenium clients without ClientConfig keep the default pool
+            logger.debug("Connection pool resize not supported by this Selenium version")
+
+    def _wait(self, timeout: int, poll_frequency: Optional[float] = None) -> WebDriverWait:
+        """
+        Get a WebDriverWait for the given timeout, reusing cached instances.
+
+        Args:
+            timeout: Wait timeout in seconds
+            poll_frequency: Seconds between checks (default: config.poll_frequency)
+
+        Returns:
+            WebDriverWait bound to the current driver
+        """
+        if poll_frequency is None:
+            poll_frequency = self.config.poll_frequency
+
+        key = (timeout, poll_frequency)
+        wait = self._wait_cache.get(key)
+        if wait is None:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+            self._wait_cache[key] = wait
+        return wait
+
+    def _set_script_timeout(self, timeout: int) -> None:
+        """
+        Set the async script timeout, skipping the command if unchanged.
+
+        Args:
+            timeout: Script timeout in seconds
+        """
+        if self._script_timeout != timeout:
+            self.driver.set_script_timeout(timeout)
+            self._script_timeout = timeout
+
+    def _get_select_all_keys(self) -> str:
+        """
+        Select-all chord for the browser's platform, followed by NULL.
+
+        NULL releases the modifier, so text typed after it in the same
+        send_keys call replaces the current value. The modifier follows the
+        machine Chrome runs on (a remote grid node may differ from this
+        host), taken from the session's platformName capability.
+
+        Returns:
+            Key sequence selecting the whole field
+        """
+        if self._select_all_keys is None:
+            platform_name = str(self.driver.capabilities.get("platformName", ""))
+            modifier = Keys.COMMAND if platform_name.lower().startswith("mac") else Keys.CONTROL
+            self._select_all_keys = modifier + "a" + Keys.NULL
+        return self._select_all_keys
+
+    @staticmethod
+    def _normalize_locator(by: By, value: str) -> Tuple[By, str]:
+        """
+        Rewrite simple XPath locators as equivalent CSS selectors.
+
+        Chrome resolves CSS selectors natively, while XPath goes through a
+        much slower evaluator. Attribute selectors keep exact-match
+        semantics, so //*[@class='a'] becomes [class="a"], not .a.
+
+        Args:
+            by: By locator strategy
+            value: Locator value
+
+        Returns:
+            (by, value) pair, converted to By.CSS_SELECTOR when possible
+
+        Examples:
+            >>> Browser._normalize_locator(By.XPATH, "//*[@id='login']")
+            ('css selector', '[id="login"]')
+            >>> Browser._normalize_locator(By.XPATH, "//div[2]")
+            ('xpath', '//div[2]')
+        """
+        if by != By.XPATH:
+            return by, value
+
+        return _xpath_to_css(value)
+
+    def navigate(self, url: str, wait_strategy: Optional[str] = None) -> Result[None]:
+        """
+        Navigate to URL and wait until the page reaches the given state.
+
+        Args:
+            url: Target URL
+            wait_strategy: "none", "domcontentloaded", "load" or "networkidle"
+                           (default: config.wait_strategy). When both are None,
+                           only page_load_strategy decides when this returns.
+                           States already guaranteed by page_load_strategy
+                           cost no extra call. Under "eager" or "none" the
+                           wait starts only once the new document has
+                           replaced the previous one.
+
+        Returns:
+            Result indicating success or failure
+
+        Examples:
+            >>> browser.navigate("https://example.com")
+            >>> browser.navigate("https://example.com/app", wait_strategy="networkidle")
+        """
+        if wait_strategy is None:
+            wait_strategy = self.config.wait_strategy
+
+        # driver.get() may return before the new document exists, and a
+        # readyState check would then pass on the old, complete one
+        previous_document = None
+        if (
+            wait_strategy is not None
+            and self.config.page_load_strategy != "normal"
+            and self._needs_ready_wait(wait_strategy)
+        ):
+            previous_document = self._document_identity()
+
+        try:
+            logger.debug("Navigating to: %s", url)
             self.driver.get(url)
+
+        except WebDriverException as e:
+            logger.error("Navigation failed: %r", e)
+            return Result.failure(f"Navigation failed: {url}", e)
+
+        if wait_strategy is None:
+            return Result.success(None, f"Navigated to {url}")
+
+        if previous_document is not None:
+            wait_result = self._wait_for_new_document(
+                previous_document, url, self.config.timeout
+            )
+            if wait_result.is_failure:
+                return Result.failure(
+                    f"Navigation failed: {url} ({wait_result.message})",
+                    wait_result.error
+                )
+
+        wait_result = self._wait_for_state(wait_strategy, self.config.timeout)
+        if wait_result.is_failure:
+            return Result.failure(
+                f"Navigation failed: {url} ({wait_result.message})",
+                wait_result.error
+            )
+
+        return Result.success(None, f"Navigated to {url}")
+
+    def _needs_ready_wait(self, wait_strategy: str) -> bool:
+        """
+        Check whether a wait strategy needs a wait beyond driver.get().
+
+        Args:
+            wait_strategy: "none", "domcontentloaded", "load" or "networkidle"
+
+        Returns:
+            False if page_load_strategy already guarantees the state
+        """
+        page_load_strategy = self.config.page_load_strategy
+
+        if wait_strategy == "none":
+            return False
+        if wait_strategy == "domcontentloaded":
+            return page_load_strategy == "none"
+        if wait_strategy == "load":
+            return page_load_strategy != "normal"
+        return True
+
+    def _document_identity(self) -> Optional[Tuple[float, str]]:
+        """
+        Get the current document's time origin and URL.
+
+        Returns:
+            (timeOrigin, URL), or None if there is no scriptable document
+        """
+        try:
+            time_origin, document_url = self.driver.execute_script(_DOCUMENT_IDENTITY_SCRIPT)
+            return time_origin, document_url
+
+        except WebDriverException as e:
+            logger.debug("Could not read current document before navigation: %r", e)
+            return None
+
+    def _wait_for_new_document(
+        self,
+        previous_document: Tuple[float, str],
+        url: str,
+        timeout: int
+    ) -> Result[None]:
+        """
+        Wait until the document loaded by driver.get(url) is the current one.
+
+        Fragment-only navigations keep the document, so they are not waited
+        for. Script errors while the old document unloads count as "not yet".
+
+        Args:
+            previous_document: (timeOrigin, URL) captured before driver.get()
+            url: URL passed to driver.get()
+            timeout: Timeout in seconds
+
+        Returns:
+            Result indicating success or failure
+        """
+        previous_origin, previous_url = previous_document
+
+        if "#" in url and urldefrag(url).url == urldefrag(previous_url).url:
+            return Result.success(None, "Same-document navigation")
+
+        def replaced(driver: webdriver.Chrome) -> bool:
+            try:
+                return driver.execute_script(_TIME_ORIGIN_SCRIPT) != previous_origin
+            except WebDriverException:
+                return False
+
+        try:
+            self._wait(timeout).until(replaced)
+            return Result.success(None, "New document loaded")
+
+        except TimeoutException as e:
+            logger.warning("New document did not replace %s within %ss", previous_url, timeout)
+            return Result.failure(f"Page load timeout ({timeout}s)", e)
+
+    def _wait_for_state(self, wait_strategy: str, timeout: int) -> Result[None]:
+        """
+        Wait in the browser for a navigation wait strategy to be satisfied.
+
+        Skips the round-trip when driver.get() has already waited that far
+        under the configured page_load_strategy.
+
+        Args:
+            wait_strategy: "none", "domcontentloaded", "load" or "networkidle"
+            timeout: Timeout in seconds
+
+        Returns:
+            Result indicating success or failure
+        """
+        if not self._needs_ready_wait(wait_strategy):
+            return Result.success(None, f"Page reached {wait_strategy}")
+
+        ready_state = "interactive" if wait_strategy == "domcontentloaded" else "complete"
+        idle_ms = _NETWORK_IDLE_MS if wait_strategy == "networkidle" else 0
+
+        try:
+            self._set_script_timeout(timeout)
+            self.driver.execute_async_script(_WAIT_FOR_READY_SCRIPT, ready_state, idle_ms)
+            return Result.success(None, f"Page reached {wait_strategy}")
+
+        except TimeoutException as e:
+            logger.warning("Page did not reach %s within %ss", wait_strategy, timeout)
+            return Result.failure(f"Page load timeout ({timeout}s)", e)
+
+        except WebDriverException as e:
+            logger.error("Page load wait failed: %r", e)
+            return Result.failure("Page load wait failed", e)
+
+    def navigate_cdp(self, url: str) -> Result[None]:
+        """
+        Navigate to URL via the DevTools Page.navigate command.
+
+        Returns as soon as the navigation is committed, regardless of
+        page_load_strategy and the page load timeout. Follow with
+        wait_for_page_load() or an element wait when the page must be ready.
+
+        Args:
+            url: Target URL
+
+        Returns:
+            Result indicating success or failure
+
+        Examples:
+            >>> browser.navigate_cdp("https://example.com/list")
+            >>> rows = browser.find_elements(By.CSS_SELECTOR, "tr.item")
+        """
+        try:
+            logger.debug("Navigating (CDP) to: %s", url)
+            response = self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
+
+            error_text = response.get("errorText")
+            if error_text:
+                logger.error("Navigation failed: %s", error_text)
+                return Result.failure(f"Navigation failed: {url} ({error_text})")
+
             return Result.success(None, f"Navigated to {url}")
 
         except WebDriverException as e:
-            logger.error(f"Navigation failed: {e}")
+            logger.error("Navigation failed: %r", e)
             return Result.failure(f"Navigation failed: {url}", e)
 
     def find_element(
         self,
         by: By,
         value: str,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        poll_frequency: Optional[float] = None
     ) -> Result[WebElement]:
-        """Find a single element with explicit wait."""
+        """
+        Find a single element with explicit wait.
+
+        Args:
+            by: By locator strategy
+            value: Locator value
+            timeout: Optional timeout in seconds
+            poll_frequency: Seconds between checks (default: config.poll_frequency)
+
+        Returns:
+            Result containing the element
+        """
+        by, value = self._normalize_locator(by, value)
+
         if timeout is None:
             timeout = self.config.timeout
 
         try:
-            logger.debug(f"Finding element: {by}={value} (timeout={timeout}s)")
+            logger.debug("Finding element: %s=%s (timeout=%ss)", by, value, timeout)
 
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout, poll_frequency)
             element = wait.until(
                 EC.presence_of_element_located((by, value))
             )
@@ -178,73 +933,176 @@ class Browser(WebBrowser):
             return Result.success(element, f"Element found: {by}={value}")
 
         except TimeoutException as e:
-            logger.warning(f"Element not found within {timeout}s: {by}={value}")
+            logger.warning("Element not found within %ss: %s=%s", timeout, by, value)
             return Result.failure(
                 f"Element not found: {by}={value} (timeout={timeout}s)",
                 e
             )
 
-        except Exception as e:
-            logger.error(f"Error finding element: {e}")
+        except WebDriverException as e:
+            logger.error("Error finding element: %r", e)
             return Result.failure(f"Error finding element: {by}={value}", e)
 
     def find_elements(
         self,
         by: By,
         value: str,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        min_count: int = 1,
+        poll_frequency: Optional[float] = None
     ) -> Result[List[WebElement]]:
-        """Find multiple elements with explicit wait."""
+        """
+        Find multiple elements with explicit wait.
+
+        Args:
+            by: By locator strategy
+            value: Locator value
+            timeout: Optional timeout in seconds
+            min_count: Wait until at least this many elements match
+                       (default: 1). With 0, return the current matches
+                       immediately, possibly an empty list. Use this for
+                       "are there any X on this page" checks to avoid
+                       waiting the full timeout when there are none.
+            poll_frequency: Seconds between checks (default: config.poll_frequency)
+
+        Returns:
+            Result containing the list of matching elements
+        """
+        by, value = self._normalize_locator(by, value)
+
         if timeout is None:
             timeout = self.config.timeout
 
         try:
-            logger.debug(f"Finding elements: {by}={value} (timeout={timeout}s)")
+            if min_count <= 0:
+                elements = self.driver.find_elements(by, value)
+                return Result.success(
+                    elements,
+                    f"Found {len(elements)} elements: {by}={value}"
+                )
 
-            wait = WebDriverWait(self.driver, timeout)
-            elements = wait.until(
-                EC.presence_of_all_elements_located((by, value))
+            logger.debug(
+                "Finding at least %s elements: %s=%s (timeout=%ss)",
+                min_count, by, value, timeout
             )
 
+            # Return the matched list from the condition itself so no
+            # extra find_elements call is needed after the wait
+            def enough_elements(driver):
+                found = driver.find_elements(by, value)
+                return found if len(found) >= min_count else False
+
+            elements = self._wait(timeout, poll_frequency).until(enough_elements)
+
             return Result.success(
                 elements,
                 f"Found {len(elements)} elements: {by}={value}"
             )
 
         except TimeoutException as e:
-            logger.warning(f"Elements not found within {timeout}s: {by}={value}")
+            logger.warning(
+                "Fewer than %s elements within %ss: %s=%s",
+                min_count, timeout, by, value
+            )
             return Result.failure(
                 f"Elements not found: {by}={value} (timeout={timeout}s)",
                 e
             )
 
-        except Exception as e:
-            logger.error(f"Error finding elements: {e}")
+        except WebDriverException as e:
+            logger.error("Error finding elements: %r", e)
             return Result.failure(f"Error finding elements: {by}={value}", e)
 
+    def find_many(
+        self,
+        selectors: List[str],
+        timeout: Optional[int] = None
+    ) -> Result[List[Optional[WebElement]]]:
+        """
+        Find the first match for each of several CSS selectors in one call.
+
+        All selectors are evaluated in a single script execution instead of
+        one find_element round-trip (and wait) per selector.
+
+        Args:
+            selectors: CSS selectors to resolve
+            timeout: Optional timeout in seconds. If omitted, the page is
+                     checked once and unmatched selectors map to None. If
+                     given, the browser polls until every selector matches
+                     and fails if any are still missing at the deadline.
+
+        Returns:
+            Result containing one WebElement (or None) per selector, in order
+
+        Examples:
+            >>> result = browser.find_many(["#email", "#password", "button[type=submit]"], timeout=10)
+            >>> if result.is_success:
+            ...     email, password, submit = result.value
+        """
+        if not selectors:
+            return Result.success([], "No selectors given")
+
+        try:
+            logger.debug("Finding %s elements by CSS (timeout=%ss)", len(selectors), timeout)
+
+            if timeout is None:
+                elements = self.driver.execute_script(
+                    "return arguments[0].map(s => document.querySelector(s));",
+                    selectors
+                )
+                return Result.success(
+                    elements,
+                    f"Found {sum(el is not None for el in elements)}/{len(selectors)} elements"
+                )
+
+            # Leave headroom so the script's own deadline fires before the driver's
+            self._set_script_timeout(timeout + 1)
+            elements = self.driver.execute_async_script(
+                _FIND_MANY_SCRIPT, selectors, timeout * 1000
+            )
+
+            missing = [s for s, el in zip(selectors, elements) if el is None]
+            if missing:
+                logger.warning("Elements not found within %ss: %s", timeout, missing)
+                return Result.failure(
+                    f"Elements not found: {', '.join(missing)} (timeout={timeout}s)"
+                )
+
+            return Result.success(elements, f"Found {len(elements)} elements")
+
+        except WebDriverException as e:
+            logger.error("Error finding elements: %r", e)
+            return Result.failure(f"Error finding elements: {selectors}", e)
+
     def click(
         self,
         by: By,
         value: str,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        poll_frequency: Optional[float] = None
     ) -> Result[None]:
-        """Click an element."""
+        """
+        Click an element once it is clickable.
+
+        Args:
+            by: By locator strategy
+            value: Locator value
+            timeout: Optional timeout in seconds
+            poll_frequency: Seconds between checks (default: config.poll_frequency)
+
+        Returns:
+            Result indicating success or failure
+        """
+        by, value = self._normalize_locator(by, value)
+
         if timeout is None:
             timeout = self.config.timeout
 
         try:
-            logger.debug(f"Clicking element: {by}={value}")
+            logger.debug("Clicking element: %s=%s", by, value)
 
-            # Find element
-            element_result = self.find_element(by, value, timeout)
-            if element_result.is_failure:
-                return Result.failure(
-                    f"Cannot click: element not found",
-                    element_result.error
-                )
-
-            # Wait for element to be clickable
-            wait = WebDriverWait(self.driver, timeout)
+            # Wait for element to be clickable (implies presence)
+            wait = self._wait(timeout, poll_frequency)
             element = wait.until(
                 EC.element_to_be_clickable((by, value))
             )
@@ -254,12 +1112,20 @@ class Browser(WebBrowser):
 
             return Result.success(None, f"Clicked: {by}={value}")
 
+        except TimeoutException as e:
+            logger.warning("Element not clickable within %ss: %s=%s", timeout, by, value)
+            return Result.failure(
+                f"Cannot click: element not found or not clickable: {by}={value} "
+                f"(timeout={timeout}s)",
+                e
+            )
+
         except ElementNotInteractableException as e:
-            logger.error(f"Element not clickable: {by}={value}")
+            logger.warning("Element not clickable: %s=%s", by, value)
             return Result.failure(f"Element not clickable: {by}={value}", e)
 
-        except Exception as e:
-            logger.error(f"Click failed: {e}")
+        except WebDriverException as e:
+            logger.error("Click failed: %r", e)
             return Result.failure(f"Click failed: {by}={value}", e)
 
     def click_javascript(
@@ -286,7 +1152,7 @@ class Browser(WebBrowser):
             timeout = self.config.timeout
 
         try:
-            logger.debug(f"Clicking element with JavaScript: {by}={value}")
+            logger.debug("Clicking element with JavaScript: %s=%s", by, value)
 
             # Find element
             element_result = self.find_element(by, value, timeout)
@@ -298,30 +1164,34 @@ class Browser(WebBrowser):
 
             element = element_result.value
 
-            # Log element details for debugging
-            is_displayed = element.is_displayed()
-            is_enabled = element.is_enabled()
-            location = element.location
-            size = element.size
-            logger.info(f"Element details - displayed: {is_displayed}, enabled: {is_enabled}, location: {location}, size: {size}")
+            # Log element details for debugging (one script call instead of
+            # is_displayed/is_enabled/location/size round-trips, skipped
+            # entirely when INFO is filtered out)
+            if logger.isEnabledFor(logging.INFO):
+                details = self.driver.execute_script(_ELEMENT_DETAILS_SCRIPT, element)
+                logger.info(
+                    "Element details - displayed: %s, enabled: %s, location: %s, size: %s",
+                    details["displayed"], details["enabled"],
+                    details["location"], details["size"]
+                )
 
-            # Scroll element into view
+            # Scroll element into view (instant scrolling completes synchronously,
+            # so no settle delay is needed before clicking)
             logger.info("Scrolling element into view...")
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-
-            # Wait a moment for scroll to complete
-            import time
-            time.sleep(0.5)
+            self.driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});",
+                element
+            )
 
             # Click using JavaScript
             logger.info("Executing JavaScript click...")
             self.driver.execute_script("arguments[0].click();", element)
 
-            logger.info(f"Successfully clicked with JavaScript: {by}={value}")
+            logger.info("Successfully clicked with JavaScript: %s=%s", by, value)
             return Result.success(None, f"Clicked (JS): {by}={value}")
 
-        except Exception as e:
-            logger.error(f"JavaScript click failed: {e}")
+        except WebDriverException as e:
+            logger.error("JavaScript click failed: %r", e)
             return Result.failure(f"JavaScript click failed: {by}={value}", e)
 
     def input_text(
@@ -329,39 +1199,75 @@ class Browser(WebBrowser):
         by: By,
         value: str,
         text: str,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        fast: bool = False,
+        poll_frequency: Optional[float] = None
     ) -> Result[None]:
-        """Input text into an element."""
+        """
+        Input text into an element, replacing its current value.
+
+        The existing value is selected (Ctrl/Cmd+A) and typed over in a
+        single send_keys() call rather than clear() followed by send_keys().
+
+        Args:
+            by: By locator strategy
+            value: Locator value
+            text: Text to input
+            timeout: Optional timeout in seconds
+            fast: Set the value with a single JavaScript call (native setter
+                  plus input/change events) instead of typing. Saves the
+                  visibility check, but no keystroke events are fired, so
+                  leave it off for fields that react to key presses.
+            poll_frequency: Seconds between checks (default: config.poll_frequency)
+
+        Returns:
+            Result indicating success or failure
+        """
+        by, value = self._normalize_locator(by, value)
+
         if timeout is None:
             timeout = self.config.timeout
 
         try:
-            logger.debug(f"Inputting text into: {by}={value}")
+            logger.debug("Inputting text into: %s=%s", by, value)
 
-            # Find element
-            element_result = self.find_element(by, value, timeout)
-            if element_result.is_failure:
-                return Result.failure(
-                    f"Cannot input text: element not found",
-                    element_result.error
-                )
+            wait = self._wait(timeout, poll_frequency)
 
-            element = element_result.value
+            if fast:
+                element = wait.until(
+                    EC.presence_of_element_located((by, value))
+                )
+                self._set_value(element, text)
+                return Result.success(None, f"Text input (JS): {by}={value}")
 
-            # Clear existing text
-            element.clear()
+            # Wait for element to be visible (implies presence)
+            element = wait.until(
+                EC.visibility_of_element_located((by, value))
+            )
 
-            # Input text
-            element.send_keys(text)
+            if text:
+                # Select-all then type: overwrites any existing value in one
+                # command, and costs nothing extra when the field is empty
+                element.send_keys(self._get_select_all_keys() + text)
+            else:
+                element.clear()
 
             return Result.success(None, f"Text input: {by}={value}")
 
+        except TimeoutException as e:
+            logger.warning("Element not visible within %ss: %s=%s", timeout, by, value)
+            return Result.failure(
+                f"Cannot input text: element not found or not visible: {by}={value} "
+                f"(timeout={timeout}s)",
+                e
+            )
+
         except ElementNotInteractableException as e:
-            logger.error(f"Element not interactable: {by}={value}")
+            logger.warning("Element not interactable: %s=%s", by, value)
             return Result.failure(f"Element not interactable: {by}={value}", e)
 
-        except Exception as e:
-            logger.error(f"Text input failed: {e}")
+        except WebDriverException as e:
+            logger.error("Text input failed: %r", e)
             return Result.failure(f"Text input failed: {by}={value}", e)
 
     def set_value_javascript(
@@ -390,7 +1296,7 @@ class Browser(WebBrowser):
             timeout = self.config.timeout
 
         try:
-            logger.debug(f"Setting value with JavaScript: {by}={value}")
+            logger.debug("Setting value with JavaScript: %s=%s", by, value)
 
             # Find element
             element_result = self.find_element(by, value, timeout)
@@ -402,39 +1308,122 @@ class Browser(WebBrowser):
 
             element = element_result.value
 
-            # Set value using React-friendly JavaScript sequence
-            # Use the native value setter so React's internal value tracker is updated
-            script = """
-                const element = arguments[0];
-                const value = arguments[1];
-                const lastValue = element.value;
+            self._set_value(element, text)
 
-                const prototype = Object.getPrototypeOf(element);
-                const descriptor = Object.getOwnPropertyDescriptor(element, 'value')
-                    || Object.getOwnPropertyDescriptor(prototype, 'value');
-                if (!descriptor || typeof descriptor.set !== 'function') {
-                    throw new Error('Unable to locate native value setter');
-                }
+            logger.debug("Successfully set value with JavaScript: %s=%s", by, value)
+            return Result.success(None, f"Set value (JS): {by}={value}")
 
-                descriptor.set.call(element, value);
+        except WebDriverException as e:
+            logger.error("Set value (JS) failed: %r", e)
+            return Result.failure(f"Set value (JS) failed: {by}={value}", e)
 
-                const tracker = element._valueTracker;
-                if (tracker) {
-                    tracker.setValue(lastValue);
-                }
+    def _set_value(self, element: WebElement, text: str) -> None:
+        """
+        Set an input's value through the preloaded value-setter helper.
 
-                element.dispatchEvent(new Event('input', { bubbles: true }));
-                element.dispatchEvent(new Event('change', { bubbles: true }));
-            """
+        The helper is registered for new documents on first use; until a
+        document is loaded after that (or if registration fails), the full
+        setter script is sent instead.
 
-            self.driver.execute_script(script, element, text)
+        Args:
+            element: Input element
+            text: Value to set
+        """
+        if not self._set_value_helper_installed:
+            self._set_value_helper_installed = True
+            try:
+                self.driver.execute_cdp_cmd(
+                    "Page.addScriptToEvaluateOnNewDocument",
+                    {"source": _SET_VALUE_HELPER_SOURCE}
+                )
+            except WebDriverException as e:
+                logger.debug("Could not preload value-setter helper: %r", e)
+            self.driver.execute_script(_SET_VALUE_SCRIPT, element, text)
+            return
 
-            logger.debug(f"Successfully set value with JavaScript: {by}={value}")
-            return Result.success(None, f"Set value (JS): {by}={value}")
+        if not self.driver.execute_script(_CALL_SET_VALUE_HELPER, element, text):
+            self.driver.execute_script(_SET_VALUE_SCRIPT, element, text)
 
-        except Exception as e:
-            logger.error(f"Set value (JS) failed: {e}")
-            return Result.failure(f"Set value (JS) failed: {by}={value}", e)
+    def batch_ops(self, ops: List[Op]) -> Result[List[Optional[str]]]:
+        """
+        Run several click/set_value/get_text operations in one script call.
+
+        Every operation normally costs at least one driver round-trip; a
+        batch costs exactly one. Elements are looked up without waiting and
+        actions are plain DOM calls (element.click(), the React-friendly
+        value setter, innerText), so only use it on a DOM already known to
+        be stable, e.g. after find_element() has waited for the form.
+
+        Args:
+            ops: Operations in order, each (kind, by, value) or
+                 ("set_value", by, value, text), where kind is "click",
+                 "set_value" or "get_text" and by is one of By.XPATH, By.ID,
+                 By.NAME, By.CLASS_NAME, By.TAG_NAME or By.CSS_SELECTOR
+
+        Returns:
+            Result containing one entry per operation: the element's text
+            for get_text, None otherwise. Fails at the first element that
+            cannot be found; earlier operations have already run.
+
+        Raises:
+            ValueError: If an operation has an unknown kind or locator
+                        strategy, or set_value has no text
+
+        Examples:
+            >>> result = browser.batch_ops([
+            ...     ("set_value", By.ID, "email", "user@example.com"),
+            ...     ("set_value", By.ID, "password", "secret"),
+            ...     ("click", By.CSS_SELECTOR, "button[type=submit]"),
+            ... ])
+        """
+        payload = []
+        for op in ops:
+            kind, by, value = op[:3]
+            if kind not in _BATCH_OP_KINDS:
+                raise ValueError(
+                    f"Unknown batch operation: {kind!r} (expected one of {_BATCH_OP_KINDS})"
+                )
+            if by not in _BATCH_LOCATOR_STRATEGIES:
+                raise ValueError(
+                    f"Unsupported batch locator strategy: {by!r} "
+                    f"(expected one of {_BATCH_LOCATOR_STRATEGIES})"
+                )
+            if kind == "set_value" and len(op) < 4:
+                raise ValueError(f"set_value operation needs text: {op!r}")
+
+            by, value = self._normalize_locator(by, value)
+            payload.append({
+                "kind": kind,
+                "by": by,
+                "value": value,
+                "text": op[3] if len(op) > 3 else None
+            })
+
+        if not payload:
+            return Result.success([], "No operations given")
+
+        try:
+            logger.debug("Running %s operations in one batch", len(payload))
+
+            outcome = self.driver.execute_script(_BATCH_OPS_SCRIPT, payload)
+
+            failed = outcome["failed"]
+            if failed is not None:
+                op = payload[failed]
+                logger.warning(
+                    "Batch stopped at operation %s: element not found: %s=%s",
+                    failed, op["by"], op["value"]
+                )
+                return Result.failure(
+                    f"Batch stopped at operation {failed} ({op['kind']}): "
+                    f"element not found: {op['by']}={op['value']}"
+                )
+
+            return Result.success(outcome["results"], f"Ran {len(payload)} operations")
+
+        except WebDriverException as e:
+            logger.error("Batch operations failed: %r", e)
+            return Result.failure(f"Batch operations failed ({len(payload)} operations)", e)
 
     def select_dropdown(
         self,
@@ -465,7 +1454,10 @@ class Browser(WebBrowser):
             timeout = self.config.timeout
 
         try:
-            logger.debug(f"Selecting dropdown option: {by}={value}, option_value={option_value}")
+            logger.debug(
+                "Selecting dropdown option: %s=%s, option_value=%s",
+                by, value, option_value
+            )
 
             # Find SELECT element
             element_result = self.find_element(by, value, timeout)
@@ -489,18 +1481,18 @@ class Browser(WebBrowser):
             )
 
         except NoSuchElementException as e:
-            logger.error(f"Dropdown option not found: value={option_value}")
+            logger.warning("Dropdown option not found: value=%s", option_value)
             return Result.failure(
                 f"Dropdown option not found: {by}={value}, value={option_value}",
                 e
             )
 
         except ElementNotInteractableException as e:
-            logger.error(f"Dropdown not interactable: {by}={value}")
+            logger.warning("Dropdown not interactable: %s=%s", by, value)
             return Result.failure(f"Dropdown not interactable: {by}={value}", e)
 
-        except Exception as e:
-            logger.error(f"Dropdown selection failed: {e}")
+        except WebDriverException as e:
+            logger.error("Dropdown selection failed: %r", e)
             return Result.failure(
                 f"Dropdown selection failed: {by}={value}, value={option_value}",
                 e
@@ -512,29 +1504,67 @@ class Browser(WebBrowser):
             source = self.driver.page_source
             return Result.success(source, "Page source retrieved")
 
-        except Exception as e:
-            logger.error(f"Failed to get page source: {e}")
+        except WebDriverException as e:
+            logger.error("Failed to get page source: %r", e)
             return Result.failure("Failed to get page source", e)
 
+    def screenshot_bytes(self) -> Result[bytes]:
+        """
+        Take screenshot and return the image bytes without touching disk.
+
+        Captured with CDP Page.captureScreenshot in config.screenshot_format
+        ("png", "jpeg" or "webp"; quality from config.screenshot_quality for
+        the lossy formats), with Chrome's optimizeForSpeed encoder.
+
+        Useful for capturing debug screenshots that are only written out
+        if a later step fails.
+
+        Returns:
+            Result containing the encoded image bytes
+
+        Examples:
+            >>> shot = browser.screenshot_bytes()
+            >>> if step_failed and shot.is_success:
+            ...     Path("output/failure.png").write_bytes(shot.value)
+        """
+        params = {
+            "format": self.config.screenshot_format,
+            "optimizeForSpeed": True,
+            "captureBeyondViewport": False,
+        }
+        if self.config.screenshot_format != "png":
+            params["quality"] = self.config.screenshot_quality
+
+        try:
+            response = self.driver.execute_cdp_cmd("Page.captureScreenshot", params)
+            data = base64.b64decode(response["data"])
+            return Result.success(data, "Screenshot captured")
+
+        except WebDriverException as e:
+            logger.error("Screenshot capture failed: %r", e)
+            return Result.failure("Screenshot capture failed", e)
+
     def screenshot(self, filepath: str) -> Result[bool]:
         """Take screenshot and save to file."""
+        capture_result = self.screenshot_bytes()
+        if capture_result.is_failure:
+            return Result.failure(f"Screenshot failed: {filepath}", capture_result.error)
+
         try:
-            # Ensure parent directory exists
+            # Ensure parent directory exists (once per directory)
             path = Path(filepath)
-            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.parent not in self._known_dirs:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(path.parent)
 
-            # Take screenshot
-            success = self.driver.save_screenshot(str(path))
+            path.write_bytes(capture_result.value)
 
-            if success:
-                logger.debug(f"Screenshot saved: {filepath}")
-                return Result.success(True, f"Screenshot saved: {filepath}")
-            else:
-                return Result.failure("Screenshot save failed")
+            logger.debug("Screenshot saved: %s", filepath)
+            return Result.success(True, f"Screenshot saved: {filepath}")
 
-        except Exception as e:
-            logger.error(f"Screenshot failed: {e}")
-            return Result.failure(f"Screenshot failed: {filepath}", e)
+        except OSError as e:
+            logger.error("Screenshot save failed: %r", e)
+            return Result.failure(f"Screenshot save failed: {filepath}", e)
 
     def wait_for_page_load(self, timeout: Optional[int] = None) -> Result[None]:
         """Wait for page to fully load."""
@@ -542,30 +1572,206 @@ class Browser(WebBrowser):
             timeout = self.config.timeout
 
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
+            # Resolve in the browser as soon as readyState becomes "complete"
+            # instead of polling execute_script from Python every 500ms
+            self._set_script_timeout(timeout)
+            self.driver.execute_async_script(_WAIT_FOR_READY_SCRIPT, "complete", 0)
 
             return Result.success(None, "Page loaded")
 
         except TimeoutException as e:
-            logger.warning(f"Page load timeout after {timeout}s")
+            logger.warning("Page load timeout after %ss", timeout)
             return Result.failure(f"Page load timeout ({timeout}s)", e)
 
-        except Exception as e:
-            logger.error(f"Page load wait failed: {e}")
+        except WebDriverException as e:
+            logger.error("Page load wait failed: %r", e)
             return Result.failure("Page load wait failed", e)
 
+    def wait_for_network_response(
+        self,
+        url_pattern: str,
+        timeout: Optional[int] = None
+    ) -> Result[Dict[str, Any]]:
+        """
+        Wait until a network request whose URL matches url_pattern finishes.
+
+        Pair with page_load_strategy="none" (or navigate_cdp) to start
+        scraping as soon as the XHR carrying the data completes, without
+        waiting for analytics beacons and other late resources.
+
+        Args:
+            url_pattern: Regular expression (JavaScript syntax) searched for
+                         in each resource URL
+            timeout: Optional timeout in seconds
+
+        Returns:
+            Result containing url, status, initiator_type, duration_ms and
+            transfer_size of the matching response
+
+        Examples:
+            >>> browser.navigate_cdp("https://example.com/app")
+            >>> result = browser.wait_for_network_response(r"/api/lessons")
+            >>> if result.is_success:
+            ...     rows = browser.find_elements(By.CSS_SELECTOR, "tr.lesson")
+        """
+        if timeout is None:
+            timeout = self.config.timeout
+
+        try:
+            logger.debug("Waiting for network response: %s (timeout=%ss)", url_pattern, timeout)
+
+            # Resource timing entries are recorded once the response body has
+            # finished loading, so a match means the data is available
+            self._set_script_timeout(timeout)
+            response = self.driver.execute_async_script(
+                _WAIT_FOR_RESPONSE_SCRIPT, url_pattern
+            )
+
+            return Result.success(response, f"Network response received: {response['url']}")
+
+        except TimeoutException as e:
+            logger.warning("No network response matching %s within %ss", url_pattern, timeout)
+            return Result.failure(
+                f"Network response not received: {url_pattern} (timeout={timeout}s)",
+                e
+            )
+
+        except WebDriverException as e:
+            logger.error("Network response wait failed: %r", e)
+            return Result.failure(f"Network response wait failed: {url_pattern}", e)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool for concurrent commands, creating it on first use."""
+        with self._driver_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.pool_size,
+                    thread_name_prefix="browser"
+                )
+            return self._executor
+
+    def gather(self, *operations: Callable[[], Result]) -> List[Result]:
+        """
+        Run several browser operations concurrently and collect their results.
+
+        Each operation runs on its own thread, so only the client side
+        overlaps: request encoding, HTTP latency and response decoding.
+        ChromeDriver may still execute commands for one session one at a
+        time, so this helps most against a remote or high-latency driver
+        and gives no speedup for work bound by the browser itself.
+        Threads are bounded by config.pool_size, the number of pooled
+        ChromeDriver connections.
+
+        Args:
+            *operations: Zero-argument callables returning a Result
+
+        Returns:
+            Results in the same order as the operations
+
+        Examples:
+            >>> email, password = browser.gather(
+            ...     lambda: browser.find_element(By.ID, "email"),
+            ...     lambda: browser.find_element(By.ID, "password"),
+            ... )
+        """
+        executor = self._get_executor()
+        futures = [executor.submit(operation) for operation in operations]
+        return [future.result() for future in futures]
+
+    async def afind_element(
+        self,
+        by: By,
+        value: str,
+        timeout: Optional[int] = None
+    ) -> Result[WebElement]:
+        """
+        Awaitable find_element, run on the browser's thread pool.
+
+        Args:
+            by: By locator strategy
+            value: Locator value
+            timeout: Optional timeout in seconds
+
+        Returns:
+            Result containing the element
+
+        Examples:
+            >>> email, password = await asyncio.gather(
+            ...     browser.afind_element(By.ID, "email"),
+            ...     browser.afind_element(By.ID, "password"),
+            ... )
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            partial(self.find_element, by, value, timeout)
+        )
+
     def close(self):
-        """Close browser and clean up resources."""
+        """
+        Close browser and clean up resources. Safe to call more than once.
+
+        With config.reuse, the session is reset and returned to the
+        browser pool instead of quitting Chrome.
+        """
+        self._wait_cache.clear()
+        self._script_timeout = None
+        self._select_all_keys = None
+        self._set_value_helper_installed = False
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if self._driver is None:
+            return
+
+        driver = self._driver
+        self._driver = None
+
+        if self.config.reuse and self._reset_for_reuse(driver):
+            default_pool.release(self.config, driver)
+            logger.info("Browser returned to pool")
+            return
+
+        try:
+            driver.quit()
+            logger.info("Browser closed")
+
+        except Exception as e:
+            logger.warning("Error closing browser: %s", e)
+
+    @staticmethod
+    def _reset_for_reuse(driver: webdriver.Chrome) -> bool:
+        """
+        Clear session state so a pooled driver can serve another Browser.
+
+        Windows and tabs opened during the session are closed, so the next
+        user starts on a single, current window. Cookies are cleared for all
+        domains; local/session storage for the origin loaded in each window.
+
+        Args:
+            driver: Driver being released
+
+        Returns:
+            True if the reset succeeded and the driver can be pooled
+        """
         try:
-            if self.driver:
-                self.driver.quit()
-                logger.info("Browser closed")
+            first, *extra = driver.window_handles
+            for handle in extra:
+                driver.switch_to.window(handle)
+                driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+                driver.close()
+            driver.switch_to.window(first)
+
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+            driver.get("about:blank")
+            return True
 
         except Exception as e:
-            logger.warning(f"Error closing browser: {e}")
+            logger.warning("Could not reset browser for reuse, closing it: %s", e)
+            return False
 
     def __enter__(self):
         """Context manager entry."""
@@ -5,18 +5,35 @@ This module provides a configuration dataclass for browser settings,
 promoting better testability and flexibility.
 """
 
+import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 
-@dataclass
+# Chrome switches that skip background work an automation session never needs
+_PERFORMANCE_ARGS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--disable-renderer-backgrounding",
+    "--disable-background-timer-throttling",
+    "--metrics-recording-only",
+    "--mute-audio",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class BrowserConfig:
     """
     Configuration for Browser initialization.
 
     This dataclass encapsulates all browser configuration options,
     making it easier to:
+    - Share one immutable, hashable configuration between browsers
     - Test different configurations
     - Create configuration presets
     - Pass configuration between components
@@ -27,8 +44,40 @@ class BrowserConfig:
         download_dir: Custom download directory
         window_size: Browser window size (width, height)
         timeout: Default timeout for operations in seconds
+        poll_frequency: Seconds between condition checks in explicit waits.
+            Lower values notice elements sooner at the cost of more
+            ChromeDriver calls per wait (cheap for a local driver)
         disable_automation_flags: Disable automation detection flags
         user_agent: Custom user agent string
+        pool_size: Max keep-alive connections to ChromeDriver
+        driver_path: Pre-resolved ChromeDriver binary (skips webdriver-manager)
+        disable_images: Block image loading and notification prompts
+        blocked_url_patterns: URL patterns (wildcards allowed) the browser
+            never requests, e.g. ("*.woff2", "*google-analytics.com*")
+        block_css: Do not download stylesheets (only for DOM-only scraping;
+            visibility/clickability checks may change without CSS)
+        block_fonts: Do not download web fonts
+        extra_chrome_args: Additional Chrome command-line switches
+        page_load_strategy: When navigate() returns: "normal" (load event),
+            "eager" (DOMContentLoaded) or "none" (as soon as navigation starts)
+        wait_strategy: Extra state navigate() waits for after the driver
+            returns: "none", "domcontentloaded", "load" or "networkidle" (no
+            resource finished for 500ms after load). None (default) relies on
+            page_load_strategy alone
+        container_mode: Add --no-sandbox and --disable-dev-shm-usage for
+            Docker/CI environments with no user namespaces and a small /dev/shm
+        user_data_dir: Persistent Chrome profile directory, reused across runs
+            to skip profile creation and keep the HTTP cache warm. Chrome locks
+            the profile, so concurrent browsers each need their own directory
+            (e.g. tempfile.mkdtemp() per worker). Only use with trusted sites
+        cache_dir: Directory where the webdriver-manager ChromeDriver path is
+            remembered, so later runs skip webdriver-manager entirely
+            (e.g. ~/.cache/technical-validation)
+        screenshot_format: Screenshot encoding: "png", "jpeg" or "webp"
+            (name screenshot files to match)
+        screenshot_quality: Compression quality (0-100) for jpeg/webp
+        reuse: On close(), reset the session and keep Chrome running in a
+            process-wide pool for the next Browser with an equal config
 
     Examples:
         >>> # Default configuration
@@ -54,8 +103,24 @@ class BrowserConfig:
     download_dir: Optional[str] = None
     window_size: Tuple[int, int] = (1920, 1080)
     timeout: int = 30
+    poll_frequency: float = 0.1
     disable_automation_flags: bool = True
     user_agent: Optional[str] = None
+    pool_size: int = 10
+    driver_path: Optional[str] = None
+    disable_images: bool = False
+    blocked_url_patterns: Tuple[str, ...] = ()
+    block_css: bool = False
+    block_fonts: bool = False
+    extra_chrome_args: Tuple[str, ...] = ()
+    page_load_strategy: str = "normal"
+    wait_strategy: Optional[str] = None
+    container_mode: bool = False
+    user_data_dir: Optional[str] = None
+    cache_dir: Optional[str] = None
+    screenshot_format: str = "png"
+    screenshot_quality: int = 80
+    reuse: bool = False
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -66,6 +131,9 @@ class BrowserConfig:
                 f"got: {self.window_size}"
             )
 
+        # Store sequences as tuples to keep the frozen config hashable
+        object.__setattr__(self, "window_size", tuple(self.window_size))
+
         width, height = self.window_size
         if width <= 0 or height <= 0:
             raise ValueError(
@@ -85,6 +153,67 @@ class BrowserConfig:
                 f"timeout must be positive, got: {self.timeout}"
             )
 
+        # Validate wait poll frequency
+        if self.poll_frequency <= 0:
+            raise ValueError(
+                f"poll_frequency must be positive, got: {self.poll_frequency}"
+            )
+
+        # Validate connection pool size
+        if self.pool_size <= 0:
+            raise ValueError(
+                f"pool_size must be positive, got: {self.pool_size}"
+            )
+
+        # Validate blocked URL patterns (a bare string would be split per character)
+        if isinstance(self.blocked_url_patterns, str) or not all(
+            isinstance(pattern, str) and pattern
+            for pattern in self.blocked_url_patterns
+        ):
+            raise ValueError(
+                f"blocked_url_patterns must be a sequence of non-empty strings, "
+                f"got: {self.blocked_url_patterns!r}"
+            )
+        object.__setattr__(self, "blocked_url_patterns", tuple(self.blocked_url_patterns))
+
+        # Validate extra Chrome switches
+        if isinstance(self.extra_chrome_args, str) or not all(
+            isinstance(arg, str) and arg.startswith("--")
+            for arg in self.extra_chrome_args
+        ):
+            raise ValueError(
+                f"extra_chrome_args must be a sequence of '--switch' strings, "
+                f"got: {self.extra_chrome_args!r}"
+            )
+        object.__setattr__(self, "extra_chrome_args", tuple(self.extra_chrome_args))
+
+        # Validate page load strategy
+        if self.page_load_strategy not in ("normal", "eager", "none"):
+            raise ValueError(
+                f"page_load_strategy must be 'normal', 'eager' or 'none', "
+                f"got: {self.page_load_strategy}"
+            )
+
+        # Validate navigation wait strategy
+        if self.wait_strategy not in (None, "none", "domcontentloaded", "load", "networkidle"):
+            raise ValueError(
+                f"wait_strategy must be 'none', 'domcontentloaded', 'load' or "
+                f"'networkidle', got: {self.wait_strategy}"
+            )
+
+        # Validate screenshot encoding
+        if self.screenshot_format not in ("png", "jpeg", "webp"):
+            raise ValueError(
+                f"screenshot_format must be 'png', 'jpeg' or 'webp', "
+                f"got: {self.screenshot_format}"
+            )
+
+        if not 0 <= self.screenshot_quality <= 100:
+            raise ValueError(
+                f"screenshot_quality must be between 0 and 100, "
+                f"got: {self.screenshot_quality}"
+            )
+
         # Validate download directory if provided
         if self.download_dir:
             path = Path(self.download_dir)
@@ -93,6 +222,32 @@ class BrowserConfig:
                     f"download_dir must be a directory, got: {self.download_dir}"
                 )
 
+        # Validate profile directory if provided
+        if self.user_data_dir:
+            path = Path(self.user_data_dir)
+            if path.exists() and not path.is_dir():
+                raise ValueError(
+                    f"user_data_dir must be a directory, got: {self.user_data_dir}"
+                )
+            if path.exists() and not os.access(path, os.W_OK):
+                raise ValueError(
+                    f"user_data_dir must be writable, got: {self.user_data_dir}"
+                )
+
+        # Validate cache directory if provided
+        if self.cache_dir:
+            path = Path(self.cache_dir)
+            if path.exists() and not path.is_dir():
+                raise ValueError(
+                    f"cache_dir must be a directory, got: {self.cache_dir}"
+                )
+
+        # Validate ChromeDriver path if provided
+        if self.driver_path and not Path(self.driver_path).is_file():
+            raise ValueError(
+                f"driver_path must be an existing file, got: {self.driver_path}"
+            )
+
     @classmethod
     def for_testing(cls) -> 'BrowserConfig':
         """
@@ -140,7 +295,8 @@ class BrowserConfig:
             download_dir: Directory for downloads
 
         Returns:
-            BrowserConfig with headless mode and production settings
+            BrowserConfig with headless mode, image loading disabled and
+            production settings
 
         Examples:
             >>> config = BrowserConfig.for_production("/var/data/downloads")
@@ -150,9 +306,38 @@ class BrowserConfig:
             headless=True,
             download_dir=download_dir,
             timeout=60,
-            disable_automation_flags=True
+            disable_automation_flags=True,
+            disable_images=True
         )
 
+    @property
+    def chrome_args(self) -> Tuple[str, ...]:
+        """
+        Chrome command-line switches for this configuration.
+
+        Computed once per distinct configuration and shared by every
+        Browser started with an equal config.
+
+        Examples:
+            >>> "--headless=new" in BrowserConfig(headless=True).chrome_args
+            True
+        """
+        return _derive_chrome_options(self)[0]
+
+    @property
+    def chrome_prefs(self) -> Dict[str, Any]:
+        """
+        Chrome profile preferences for this configuration.
+
+        Returns a new dict on each access, so callers may modify it.
+
+        Examples:
+            >>> BrowserConfig(disable_images=True).chrome_prefs[
+            ...     "profile.managed_default_content_settings.images"]
+            2
+        """
+        return dict(_derive_chrome_options(self)[1])
+
     def to_dict(self) -> dict:
         """
         Convert configuration to dictionary.
@@ -170,6 +355,80 @@ class BrowserConfig:
             "download_dir": self.download_dir,
             "window_size": self.window_size,
             "timeout": self.timeout,
+            "poll_frequency": self.poll_frequency,
             "disable_automation_flags": self.disable_automation_flags,
             "user_agent": self.user_agent,
+            "pool_size": self.pool_size,
+            "driver_path": self.driver_path,
+            "disable_images": self.disable_images,
+            "blocked_url_patterns": self.blocked_url_patterns,
+            "block_css": self.block_css,
+            "block_fonts": self.block_fonts,
+            "extra_chrome_args": self.extra_chrome_args,
+            "page_load_strategy": self.page_load_strategy,
+            "wait_strategy": self.wait_strategy,
+            "container_mode": self.container_mode,
+            "user_data_dir": self.user_data_dir,
+            "cache_dir": self.cache_dir,
+            "screenshot_format": self.screenshot_format,
+            "screenshot_quality": self.screenshot_quality,
+            "reuse": self.reuse,
         }
+
+
+@lru_cache(maxsize=32)
+def _derive_chrome_options(
+    config: BrowserConfig
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, Any], ...]]:
+    """
+    Derive Chrome switches and prefs, cached per (hashable) configuration.
+
+    Args:
+        config: Browser configuration
+
+    Returns:
+        (arguments, prefs items) as immutable tuples
+    """
+    arguments = []
+    prefs = []
+
+    if config.headless:
+        arguments.append("--headless=new")
+
+    if config.container_mode:
+        arguments.append("--no-sandbox")
+        arguments.append("--disable-dev-shm-usage")
+
+    arguments.extend(_PERFORMANCE_ARGS)
+
+    # Set window size
+    width, height = config.window_size
+    arguments.append(f"--window-size={width},{height}")
+
+    # Disable automation flags if requested
+    if config.disable_automation_flags:
+        arguments.append("--disable-blink-features=AutomationControlled")
+
+    # Set custom user agent if provided
+    if config.user_agent:
+        arguments.append(f"--user-agent={config.user_agent}")
+
+    # Reuse a persistent profile instead of a throwaway one
+    if config.user_data_dir:
+        arguments.append(f"--user-data-dir={Path(config.user_data_dir).absolute()}")
+        arguments.append("--profile-directory=Default")
+
+    # Custom download directory
+    if config.download_dir:
+        prefs.append(("download.default_directory", str(Path(config.download_dir).absolute())))
+        prefs.append(("download.prompt_for_download", False))
+
+    # Skip image downloads (CSS is kept so layout-dependent clicks still work)
+    if config.disable_images:
+        prefs.append(("profile.managed_default_content_settings.images", 2))
+        prefs.append(("profile.default_content_setting_values.notifications", 2))
+        arguments.append("--blink-settings=imagesEnabled=false")
+
+    arguments.extend(config.extra_chrome_args)
+
+    return tuple(arguments), tuple(prefs)
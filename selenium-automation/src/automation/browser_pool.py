@@ -0,0 +1,138 @@
+"""
+Pool of idle ChromeDriver sessions.
+
+Starting Chrome costs 1-3 seconds per Browser. With BrowserConfig(reuse=True),
+Browser.close() resets the session and parks the driver here instead of
+quitting it, and the next Browser with an equal configuration picks it up.
+Pooled drivers are quit when the interpreter exits.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from typing import Dict, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .browser_config import BrowserConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Thread-safe pool of idle WebDriver sessions keyed by BrowserConfig.
+
+    Drivers are handed out most-recently-released first, so a small
+    working set stays warm.
+
+    Examples:
+        >>> pool = BrowserPool()
+        >>> driver = pool.acquire(config)  # None if nothing idle
+        >>> if driver is None:
+        ...     driver = start_new_driver(config)
+        >>> pool.release(config, driver)
+        >>> pool.shutdown_all()
+    """
+
+    def __init__(self):
+        """Initialize empty pool."""
+        self._idle: Dict[BrowserConfig, queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+
+    def _queue_for(self, config: BrowserConfig) -> queue.LifoQueue:
+        """Get (or create) the idle queue for a configuration."""
+        with self._lock:
+            idle = self._idle.get(config)
+            if idle is None:
+                idle = queue.LifoQueue()
+                self._idle[config] = idle
+            return idle
+
+    def acquire(self, config: BrowserConfig) -> Optional[WebDriver]:
+        """
+        Take an idle driver started with an equal configuration.
+
+        Each candidate is probed with one cheap command first; drivers
+        whose Chrome crashed or whose session expired while idle are
+        quit and skipped.
+
+        Args:
+            config: Browser configuration
+
+        Returns:
+            Live idle WebDriver, or None if the pool has none for this config
+        """
+        idle = self._queue_for(config)
+
+        while True:
+            try:
+                driver = idle.get_nowait()
+            except queue.Empty:
+                return None
+
+            try:
+                driver.current_url
+            except WebDriverException as e:
+                logger.warning("Discarding dead pooled browser session: %s", e)
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                continue
+
+            logger.debug("Reusing pooled browser session")
+            return driver
+
+    def release(self, config: BrowserConfig, driver: WebDriver) -> None:
+        """
+        Return a driver to the pool.
+
+        Args:
+            config: Configuration the driver was started with
+            driver: Driver whose session has already been reset
+        """
+        self._queue_for(config).put(driver)
+        logger.debug("Browser session returned to pool")
+
+    def idle_count(self, config: Optional[BrowserConfig] = None) -> int:
+        """
+        Count idle drivers.
+
+        Args:
+            config: Only count drivers for this configuration (default: all)
+
+        Returns:
+            Number of idle drivers
+        """
+        with self._lock:
+            if config is not None:
+                idle = self._idle.get(config)
+                return idle.qsize() if idle is not None else 0
+            return sum(idle.qsize() for idle in self._idle.values())
+
+    def shutdown_all(self) -> None:
+        """Quit every idle driver and empty the pool."""
+        with self._lock:
+            queues = list(self._idle.values())
+            self._idle.clear()
+
+        for idle in queues:
+            while True:
+                try:
+                    driver = idle.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.warning("Error closing pooled browser: %s", e)
+
+
+# Process-wide pool used by Browser when BrowserConfig.reuse is set
+default_pool = BrowserPool()
+atexit.register(default_pool.shutdown_all)
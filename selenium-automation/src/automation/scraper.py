@@ -2,22 +2,417 @@
 HTML scraping and data extraction.
 
 This module provides HTML parsing and data extraction using BeautifulSoup
-with support for tables, structured data, and text extraction.
+(or selectolax's Lexbor parser, if installed) with support for tables,
+structured data, and text extraction.
 """
 
+import io
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 
 import pandas as pd
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+from lxml import etree
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional: pip install selectolax
+    LexborHTMLParser = None
 
 
 logger = logging.getLogger(__name__)
 
+# Selectors that only constrain the element itself ("table", "table.data",
+# "table#main[border]"), so a document holding just the elements with that
+# tag gives the same matches as the full page
+_TAG_ONLY_SELECTOR_RE = re.compile(r"^(?P<tag>[A-Za-z][A-Za-z0-9-]*)(?:[.#\[][^\s>+~,:]*)?$")
+
+# Elements whose contents are not page text; BeautifulSoup's get_text()
+# skips script, style and template strings, Lexbor's text() does not
+_NON_TEXT_TAGS = ("script", "style", "noscript", "template")
+
+
+@lru_cache(maxsize=512)
+def _compile(selector: str) -> soupsieve.SoupSieve:
+    """
+    Compile a CSS selector with soupsieve once and reuse it.
+
+    Tag.select()/select_one() redo soupsieve's argument handling and cache
+    lookup on every call, which adds up over items x fields lookups.
+
+    Args:
+        selector: CSS selector
+
+    Returns:
+        Compiled selector
+    """
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=1)
+def _string_dtype() -> pd.StringDtype:
+    """
+    String dtype for scraped columns.
+
+    Arrow-backed strings store a column as one buffer instead of a Python
+    object per cell; falls back to pandas' own string dtype without pyarrow.
+
+    Returns:
+        StringDtype("pyarrow") if pyarrow is installed, else StringDtype()
+    """
+    try:
+        return pd.StringDtype("pyarrow")
+    except ImportError:
+        return pd.StringDtype()
+
+
+def _is_hidden(node: Any) -> bool:
+    """Whether node is hidden with an inline display:none (skipped like pd.read_html)."""
+    return "display:none" in (node.get("style") or "").replace(" ", "")
+
+
+def _span(cell: Any, attribute: str) -> int:
+    """colspan/rowspan of a cell (1 if missing or invalid)."""
+    try:
+        return max(1, int(cell.get(attribute) or 1))
+    except ValueError:
+        return 1
+
+
+def _soup_text(node: Tag) -> str:
+    """Text of a BeautifulSoup node, with <br> read as a space."""
+    parts = []
+    for child in node.descendants:
+        if isinstance(child, Tag):
+            if child.name == "br":
+                parts.append(" ")
+        elif type(child) is NavigableString:
+            # Comments, CDATA, etc. are NavigableString subclasses
+            parts.append(child)
+    return "".join(parts)
+
+
+def _element_text(node: etree._Element) -> str:
+    """Text of an lxml element, with <br> read as a space."""
+    parts = []
+
+    def walk(element: etree._Element) -> None:
+        # Comments and processing instructions have a non-string tag
+        if isinstance(element.tag, str):
+            if element.tag.lower() == "br":
+                parts.append(" ")
+            else:
+                parts.append(element.text or "")
+                for child in element:
+                    walk(child)
+        if element is not node:
+            parts.append(element.tail or "")
+
+    walk(node)
+    return "".join(parts)
+
+
+def _expand_spans(rows: List[List[Any]], text: Callable[[Any], str]) -> List[List[Optional[str]]]:
+    """
+    Turn rows of cells into a grid of texts, repeating colspan/rowspan cells.
+
+    Same algorithm as pd.read_html; rowspans do not cross table sections.
+
+    Args:
+        rows: Cells of each row
+        text: Full text content of a cell
+
+    Returns:
+        Collapsed-whitespace text per grid cell (None if empty)
+    """
+    grid: List[List[Optional[str]]] = []
+    # (column, text, rows still to fill) carried over from rows above
+    remainder: List[Tuple[int, Optional[str], int]] = []
+    texts: List[Optional[str]] = []
+    next_remainder: List[Tuple[int, Optional[str], int]] = []
+
+    def carry_over(up_to: Optional[int]) -> None:
+        """Place spanning cells from above that start at or before column up_to."""
+        while remainder and (up_to is None or remainder[0][0] <= up_to):
+            column, value, rows_left = remainder.pop(0)
+            texts.append(value)
+            if rows_left > 1:
+                next_remainder.append((column, value, rows_left - 1))
+
+    for cells in rows:
+        texts = []
+        next_remainder = []
+
+        for cell in cells:
+            carry_over(len(texts))
+            value = " ".join(text(cell).split()) or None
+            rowspan = _span(cell, "rowspan")
+            for _ in range(_span(cell, "colspan")):
+                if rowspan > 1:
+                    next_remainder.append((len(texts), value, rowspan - 1))
+                texts.append(value)
+
+        carry_over(None)
+        grid.append(texts)
+        remainder = next_remainder
+
+    # Rows that only exist because of a rowspan from the last real row
+    while remainder:
+        texts = []
+        next_remainder = []
+        carry_over(None)
+        grid.append(texts)
+        remainder = next_remainder
+
+    return grid
+
+
+def _dedupe_labels(labels: List[Any]) -> List[Any]:
+    """Rename repeated labels to "A", "A.1", "A.2", ... as pandas readers do."""
+    counts: Dict[Any, int] = {}
+    result = []
+    for label in labels:
+        count = counts.get(label, 0)
+        while count > 0:
+            counts[label] = count + 1
+            label = f"{label}.{count}"
+            count = counts.get(label, 0)
+        result.append(label)
+        counts[label] = count + 1
+    return result
+
+
+def _frame_from_table(
+    table: Any,
+    children: Callable[[Any], List[Any]],
+    name: Callable[[Any], str],
+    text: Callable[[Any], str]
+) -> Optional[pd.DataFrame]:
+    """
+    Build a DataFrame by walking a parsed table's own rows.
+
+    Works on any tree through the children/name/text accessors (bs4 tags
+    and lxml elements both provide .get() for attributes). Follows
+    pd.read_html for row order (thead, body, tfoot), header detection,
+    colspan/rowspan expansion, whitespace collapsing, padding, "Unnamed: n"
+    and "A.1" header labels, multi-row (MultiIndex) headers and
+    display:none skipping. Unlike read_html, values are never type-inferred:
+    every column has the same string dtype.
+
+    Args:
+        table: Table node
+        children: Child elements of a node
+        name: Lowercase tag name of a node
+        text: Full text content of a node
+
+    Returns:
+        DataFrame of string columns; empty cells are <NA>. None if the
+        table has no rows with visible cells (read_html skips those)
+    """
+    sections: Dict[str, List[Any]] = {"thead": [], "tbody": [], "tfoot": []}
+
+    for child in children(table):
+        if _is_hidden(child):
+            continue
+        tag = name(child)
+        if tag == "tr":
+            sections["tbody"].append(child)
+        elif tag in sections:
+            sections[tag].extend(row for row in children(child) if name(row) == "tr")
+
+    def cells_of(rows: List[Any]) -> List[List[Any]]:
+        cells = [
+            [cell for cell in children(row) if name(cell) in ("td", "th") and not _is_hidden(cell)]
+            for row in rows if not _is_hidden(row)
+        ]
+        return [row for row in cells if row]
+
+    head = cells_of(sections["thead"])
+    body = cells_of(sections["tbody"])
+    if not head:
+        # Without a <thead>, leading rows made only of <th> are the header
+        while body and all(name(cell) == "th" for cell in body[0]):
+            head.append(body.pop(0))
+
+    header_rows = _expand_spans(head, text)
+    rows = _expand_spans(body, text) + _expand_spans(cells_of(sections["tfoot"]), text)
+    if not header_rows and not rows:
+        return None
+
+    # Pad short rows (and the header) like read_html does
+    width = max((len(row) for row in header_rows + rows), default=0)
+    rows = [row + [None] * (width - len(row)) for row in rows]
+
+    columns: Any = None
+    if header_rows:
+        header_rows = [row + [None] * (width - len(row)) for row in header_rows]
+        if len(header_rows) == 1:
+            columns = _dedupe_labels([
+                label if label is not None else f"Unnamed: {index}"
+                for index, label in enumerate(header_rows[0])
+            ])
+        else:
+            columns = pd.MultiIndex.from_arrays([
+                [
+                    label if label is not None else f"Unnamed: {index}_level_{level}"
+                    for index, label in enumerate(row)
+                ]
+                for level, row in enumerate(header_rows)
+            ])
+
+    return pd.DataFrame(rows, columns=columns, dtype=_string_dtype())
+
+
+def _table_to_frame(table: Tag) -> Optional[pd.DataFrame]:
+    """
+    Build a DataFrame from an already parsed BeautifulSoup <table>.
+
+    Walks the rows directly instead of serializing the table and parsing
+    it again with pd.read_html.
+
+    Args:
+        table: Parsed table element
+
+    Returns:
+        DataFrame with the header row(s) (<thead>, or leading all-<th>
+        rows) as columns, or None if the table has no rows
+    """
+    return _frame_from_table(
+        table,
+        children=lambda node: node.find_all(True, recursive=False),
+        name=lambda node: node.name,
+        text=_soup_text
+    )
+
+
+def _element_to_frame(table: etree._Element) -> Optional[pd.DataFrame]:
+    """
+    Build a DataFrame from an lxml <table> element (see _table_to_frame).
+
+    Args:
+        table: Parsed table element
+
+    Returns:
+        DataFrame with the header row(s) as columns, or None if the table
+        has no rows
+    """
+    return _frame_from_table(
+        table,
+        # Skip comments and processing instructions
+        children=lambda node: [child for child in node if isinstance(child.tag, str)],
+        name=lambda node: node.tag.lower(),
+        text=_element_text
+    )
+
+
+class _Backend(ABC):
+    """
+    Parsed document plus the node operations Scraper needs.
+
+    Nodes are backend-specific and only passed back into the same backend.
+    """
+
+    @abstractmethod
+    def select_one(self, selector: str, root: Any = None) -> Any:
+        """First node matching selector below root (default: document), or None."""
+
+    @abstractmethod
+    def select(self, selector: str, root: Any = None) -> List[Any]:
+        """All nodes matching selector below root (default: document)."""
+
+    @abstractmethod
+    def text(self, node: Any = None, separator: str = "") -> str:
+        """Stripped text pieces of node (default: document) joined by separator."""
+
+    @abstractmethod
+    def attribute(self, node: Any, name: str) -> Optional[Any]:
+        """Attribute value of node, or None if it has no such attribute."""
+
+
+class _SoupBackend(_Backend):
+    """BeautifulSoup tree queried through soupsieve."""
+
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+
+    def select_one(self, selector: str, root: Any = None) -> Any:
+        return _compile(selector).select_one(self.soup if root is None else root)
+
+    def select(self, selector: str, root: Any = None) -> List[Any]:
+        return _compile(selector).select(self.soup if root is None else root)
+
+    def text(self, node: Any = None, separator: str = "") -> str:
+        return (self.soup if node is None else node).get_text(separator=separator, strip=True)
+
+    def attribute(self, node: Any, name: str) -> Optional[Any]:
+        return node.attrs.get(name)
+
+
+class _LexborBackend(_Backend):
+    """
+    selectolax Lexbor tree: C parser and C selector engine.
+
+    Lexbor's node.css() also matches the node itself, so scoped queries
+    drop it to keep BeautifulSoup's descendants-only semantics. Likewise
+    text() leaves out script, style, noscript and template contents below
+    the node, which Lexbor would otherwise include, and drops
+    whitespace-only strings the way get_text(strip=True) does.
+    """
+
+    def __init__(self, html: str):
+        self.tree = LexborHTMLParser(html)
+
+    def select_one(self, selector: str, root: Any = None) -> Any:
+        if root is None:
+            return self.tree.css_first(selector)
+
+        node = root.css_first(selector)
+        if node is not None and node == root:
+            matches = self.select(selector, root)
+            node = matches[0] if matches else None
+        return node
+
+    def select(self, selector: str, root: Any = None) -> List[Any]:
+        if root is None:
+            return self.tree.css(selector)
+        return [node for node in root.css(selector) if node != root]
+
+    def text(self, node: Any = None, separator: str = "") -> str:
+        if node is None:
+            node = self.tree.root
+            if node is None:
+                return ""
+
+        if self.select(", ".join(_NON_TEXT_TAGS), node):
+            # strip_tags() edits the tree in place, so work on a copy
+            node = node.clone()
+            node.strip_tags(list(_NON_TEXT_TAGS))
+
+        # node.text(strip=True) keeps whitespace-only strings as empty
+        # pieces between separators; get_text(strip=True) drops them
+        pieces = (
+            child.text_content.strip()
+            for child in node.traverse(include_text=True)
+            if child.is_text_node
+        )
+        return separator.join(piece for piece in pieces if piece)
+
+    def attribute(self, node: Any, name: str) -> Optional[Any]:
+        attributes = node.attributes
+        if name not in attributes:
+            return None
+        # Boolean attributes (<input disabled>) have no value in Lexbor
+        value = attributes[name]
+        return "" if value is None else value
+
 
 class Scraper:
     """
-    HTML scraper using BeautifulSoup.
+    HTML scraper using BeautifulSoup or selectolax.
 
     Provides methods for:
     - Text extraction
@@ -31,23 +426,100 @@ class Scraper:
         >>> df = scraper.extract_table("table.data")
     """
 
-    def __init__(self, html: str, parser: str = "lxml"):
+    def __init__(
+        self,
+        html: str,
+        parser: str = "lxml",
+        only_tags: Optional[Iterable[str]] = None
+    ):
         """
         Initialize scraper with HTML content.
 
+        The HTML is parsed on first use, not here.
+
         Args:
             html: HTML string to parse
-            parser: Parser to use (default: "lxml")
+            parser: Parser to use (default: "lxml"). "selectolax" parses
+                    with selectolax's Lexbor engine for text, attribute and
+                    structured-data lookups (much faster on large pages;
+                    requires the selectolax package); tables still go
+                    through BeautifulSoup with lxml.
+            only_tags: Only build the tree for elements with these tags
+                       (and their contents), skipping everything else.
+                       Cuts parse time and memory on large pages when only
+                       e.g. tables are needed. Not supported by "html5lib";
+                       with "selectolax" it applies to tables only.
+
+        Raises:
+            ImportError: If parser is "selectolax" but it is not installed
 
         Examples:
             >>> scraper = Scraper(html_string)
             >>> scraper = Scraper(html_string, parser="html.parser")
+            >>> scraper = Scraper(html_string, only_tags=["table"])
+            >>> scraper = Scraper(html_string, parser="selectolax")
         """
+        if parser == "selectolax" and LexborHTMLParser is None:
+            raise ImportError(
+                'parser="selectolax" requires the selectolax package (pip install selectolax)'
+            )
+
         self.html = html
-        self.soup = BeautifulSoup(html, parser)
+        self.parser = parser
+        self._strainer = SoupStrainer(list(only_tags)) if only_tags else None
+        self._soup: Optional[BeautifulSoup] = None
+        self._tag_soups: Dict[str, BeautifulSoup] = {}
+        self._document: Optional[_Backend] = None
 
         logger.debug(f"Scraper initialized with {len(html)} bytes of HTML")
 
+    @property
+    def _soup_parser(self) -> str:
+        """Parser name to hand to BeautifulSoup."""
+        return "lxml" if self.parser == "selectolax" else self.parser
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """Parsed document (restricted to only_tags if given), parsed on first access."""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, self._soup_parser, parse_only=self._strainer)
+        return self._soup
+
+    @property
+    def _backend(self) -> _Backend:
+        """Document used for text, attribute and structured-data lookups."""
+        if self._document is None:
+            if self.parser == "selectolax":
+                self._document = _LexborBackend(self.html)
+            else:
+                self._document = _SoupBackend(self.soup)
+        return self._document
+
+    def _soup_for(self, selector: str) -> BeautifulSoup:
+        """
+        Get a tree to run a tag-only selector against.
+
+        If the full document has not been parsed yet, parses just the
+        elements with the selector's tag instead (cached per tag), so
+        table-only callers never pay for the rest of the page.
+
+        Args:
+            selector: CSS selector
+
+        Returns:
+            BeautifulSoup tree that gives the same matches as the full page
+        """
+        match = _TAG_ONLY_SELECTOR_RE.match(selector)
+        if self._soup is not None or self._strainer is not None or match is None:
+            return self.soup
+
+        tag = match.group("tag").lower()
+        soup = self._tag_soups.get(tag)
+        if soup is None:
+            soup = BeautifulSoup(self.html, self._soup_parser, parse_only=SoupStrainer(tag))
+            self._tag_soups[tag] = soup
+        return soup
+
     def get_text(self, selector: Optional[str] = None) -> str:
         """
         Extract text content.
@@ -65,12 +537,14 @@ class Scraper:
             >>> # Specific element
             >>> title = scraper.get_text(".page-title")
         """
+        backend = self._backend
+
         if selector is None:
-            text = self.soup.get_text(separator=' ', strip=True)
+            text = backend.text(separator=' ')
         else:
-            element = self.soup.select_one(selector)
-            if element:
-                text = element.get_text(separator=' ', strip=True)
+            element = backend.select_one(selector)
+            if element is not None:
+                text = backend.text(element, separator=' ')
             else:
                 logger.warning(f"Element not found: {selector}")
                 text = ""
@@ -88,7 +562,8 @@ class Scraper:
             selector: CSS selector for table element
 
         Returns:
-            DataFrame with table data, or None if not found
+            DataFrame with table data (cell values as strings), or None if
+            not found or the table has no rows
 
         Examples:
             >>> df = scraper.extract_table("table.lesson-list")
@@ -96,14 +571,17 @@ class Scraper:
             ...     print(df.head())
         """
         try:
-            table = self.soup.select_one(selector)
+            table = _compile(selector).select_one(self._soup_for(selector))
 
             if not table:
                 logger.warning(f"Table not found: {selector}")
                 return None
 
             # Extract table to DataFrame
-            df = pd.read_html(str(table))[0]
+            df = _table_to_frame(table)
+            if df is None:
+                logger.warning(f"Table has no rows: {selector}")
+                return None
 
             logger.debug(
                 f"Extracted table: {df.shape[0]} rows, {df.shape[1]} columns"
@@ -122,19 +600,35 @@ class Scraper:
         """
         Extract all matching tables as DataFrames.
 
+        With the default selector on a page nothing has parsed yet, this
+        is list(iter_tables()), which yields the same tables in the same
+        (document) order without holding the whole page in memory.
+
         Args:
             selector: CSS selector for table elements
 
         Returns:
-            List of DataFrames
+            List of DataFrames (cell values as strings); tables without
+            rows are skipped
 
         Examples:
             >>> tables = scraper.extract_tables("table")
             >>> for i, df in enumerate(tables):
             ...     print(f"Table {i}: {df.shape}")
         """
+        if (
+            selector == "table" and self._soup is None
+            and self._strainer is None and self._soup_parser == "lxml"
+        ):
+            # Nothing parsed yet and every table wanted: stream them
+            dataframes = list(self.iter_tables())
+            if not dataframes:
+                logger.warning(f"No tables found: {selector}")
+            logger.debug(f"Extracted {len(dataframes)} tables")
+            return dataframes
+
         try:
-            tables = self.soup.select(selector)
+            tables = _compile(selector).select(self._soup_for(selector))
 
             if not tables:
                 logger.warning(f"No tables found: {selector}")
@@ -143,8 +637,9 @@ class Scraper:
             dataframes = []
             for table in tables:
                 try:
-                    df = pd.read_html(str(table))[0]
-                    dataframes.append(df)
+                    df = _table_to_frame(table)
+                    if df is not None:
+                        dataframes.append(df)
                 except Exception as e:
                     logger.warning(f"Failed to parse table: {e}")
 
@@ -156,6 +651,74 @@ class Scraper:
             logger.error(f"Failed to extract tables: {e}")
             return []
 
+    def iter_tables(self) -> Iterator[pd.DataFrame]:
+        """
+        Stream every table on the page as a DataFrame, in document order.
+
+        Parses incrementally with lxml's iterparse. Once an outermost table
+        is converted, it and everything before it (including the preceding
+        siblings of its ancestors) is dropped from the tree. Memory is
+        therefore bounded by the largest table plus the markup between two
+        tables, not by the whole page. Does not build self.soup.
+
+        Nested tables come out in document order too (outer before inner),
+        the same as extract_tables() on a parsed document; they are held
+        back until the outermost table containing them closes.
+
+        Yields:
+            DataFrame per table (tables without rows are skipped; tables
+            that fail to convert are logged and skipped)
+
+        Examples:
+            >>> for df in scraper.iter_tables():
+            ...     if "Student" in df.columns:
+            ...         break
+        """
+        events = etree.iterparse(
+            io.BytesIO(self.html.encode("utf-8")),
+            events=("start", "end"),
+            tag="table",
+            html=True,
+            encoding="utf-8",
+            remove_blank_text=True
+        )
+
+        # Position of each open table in document order, and frames of the
+        # current outermost table and its nested tables, keyed the same way
+        open_tables: List[int] = []
+        pending: Dict[int, Optional[pd.DataFrame]] = {}
+        started = 0
+
+        for event, element in events:
+            if event == "start":
+                open_tables.append(started)
+                started += 1
+                continue
+
+            position = open_tables.pop()
+            try:
+                pending[position] = _element_to_frame(element)
+            except Exception as e:
+                logger.warning(f"Failed to parse table: {e}")
+                pending[position] = None
+
+            # An enclosing table still needs its nested tables
+            if open_tables:
+                continue
+
+            for position in sorted(pending):
+                if pending[position] is not None:
+                    yield pending[position]
+            pending.clear()
+
+            element.clear()
+            for node in [element, *element.iterancestors()]:
+                parent = node.getparent()
+                if parent is None:
+                    break
+                while node.getprevious() is not None:
+                    del parent[0]
+
     def extract_structured_data(
         self,
         item_selector: str,
@@ -184,7 +747,8 @@ class Scraper:
             >>> for lesson in lessons:
             ...     print(f"{lesson['date']}: {lesson['student_name']}")
         """
-        items = self.soup.select(item_selector)
+        backend = self._backend
+        items = backend.select(item_selector)
 
         if not items:
             logger.warning(f"No items found: {item_selector}")
@@ -196,11 +760,11 @@ class Scraper:
             data = {}
 
             for field_name, field_selector in field_selectors.items():
-                element = item.select_one(field_selector)
+                element = backend.select_one(field_selector, item)
 
-                if element:
+                if element is not None:
                     # Get text content
-                    data[field_name] = element.get_text(strip=True)
+                    data[field_name] = backend.text(element)
                 else:
                     # Field not found
                     data[field_name] = None
@@ -211,6 +775,55 @@ class Scraper:
 
         return results
 
+    def extract_structured_data_df(
+        self,
+        item_selector: str,
+        field_selectors: Dict[str, str]
+    ) -> pd.DataFrame:
+        """
+        Extract structured data from repeating elements as a DataFrame.
+
+        Same lookups as extract_structured_data(), but values are collected
+        per column and stored as string columns (Arrow-backed when pyarrow is
+        installed) instead of one dict per item. Much smaller for large
+        result sets and ready for vectorized processing.
+
+        Args:
+            item_selector: CSS selector for each item container
+            field_selectors: Dict mapping field names to CSS selectors
+
+        Returns:
+            DataFrame with one row per item and one string column per field
+            (missing fields are <NA>); empty if no items match
+
+        Examples:
+            >>> df = scraper.extract_structured_data_df(
+            ...     item_selector=".lesson-item",
+            ...     field_selectors={"date": ".lesson-date", "status": ".lesson-status"}
+            ... )
+            >>> done = df[df["status"] == "completed"]
+        """
+        backend = self._backend
+        items = backend.select(item_selector)
+
+        if not items:
+            logger.warning(f"No items found: {item_selector}")
+
+        columns: Dict[str, List[Optional[str]]] = {name: [] for name in field_selectors}
+
+        for item in items:
+            for field_name, field_selector in field_selectors.items():
+                element = backend.select_one(field_selector, item)
+                columns[field_name].append(
+                    backend.text(element) if element is not None else None
+                )
+
+        df = pd.DataFrame(columns, index=pd.RangeIndex(len(items)), dtype=_string_dtype())
+
+        logger.debug(f"Extracted {len(df)} items")
+
+        return df
+
     def find_element_text(
         self,
         selector: str,
@@ -229,10 +842,11 @@ class Scraper:
         Examples:
             >>> title = scraper.find_element_text(".page-title", "No Title")
         """
-        element = self.soup.select_one(selector)
+        backend = self._backend
+        element = backend.select_one(selector)
 
-        if element:
-            return element.get_text(strip=True)
+        if element is not None:
+            return backend.text(element)
 
         return default
 
@@ -252,8 +866,9 @@ class Scraper:
         Examples:
             >>> names = scraper.find_elements_text(".student-name")
         """
-        elements = self.soup.select(selector)
-        return [el.get_text(strip=True) for el in elements]
+        backend = self._backend
+        elements = backend.select(selector)
+        return [backend.text(el) for el in elements]
 
     def get_attribute(
         self,
@@ -276,10 +891,13 @@ class Scraper:
             >>> url = scraper.get_attribute("a.link", "href")
             >>> img_src = scraper.get_attribute("img", "src")
         """
-        element = self.soup.select_one(selector)
+        backend = self._backend
+        element = backend.select_one(selector)
 
-        if element and attribute in element.attrs:
-            return element[attribute]
+        if element is not None:
+            value = backend.attribute(element, attribute)
+            if value is not None:
+                return value
 
         return default
 
@@ -297,4 +915,4 @@ class Scraper:
             >>> if scraper.has_element(".error-message"):
             ...     print("Error detected")
         """
-        return self.soup.select_one(selector) is not None
+        return self._backend.select_one(selector) is not None
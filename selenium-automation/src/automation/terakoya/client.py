@@ -9,7 +9,10 @@ import logging
 import os
 import time
 import platform
+import threading
+import uuid
 from pathlib import Path
+from contextlib import nullcontext
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
@@ -28,7 +31,6 @@ from ...validation.lesson_validator import LessonValidator
 from ...validation.invoice_validator import InvoiceItemValidator
 from ...resilience.circuit_breaker import CircuitBreaker
 from ...utils.config import SecureString
-from ...utils.ai_extractor import AIExtractor
 
 
 logger = logging.getLogger(__name__)
@@ -73,7 +75,8 @@ class TerakoyaClient:
         self,
         browser: Browser,
         base_url: str = "https://terakoya.sejuku.net",
-        screenshot_dir: Optional[Path] = None
+        screenshot_dir: Optional[Path] = None,
+        save_lock: Optional[threading.Lock] = None
     ):
         """
         Initialize TerakoyaClient.
@@ -82,8 +85,13 @@ class TerakoyaClient:
             browser: Browser instance
             base_url: Base URL of Terakoya site
             screenshot_dir: Directory for saving screenshots (optional)
+            save_lock: Lock held while saving an invoice item. Share one
+                       lock between clients writing to the same invoice so
+                       their saves never hit the server concurrently
+                       (optional)
         """
         self.browser = browser
+        self.save_lock = save_lock
         self.base_url = base_url.rstrip('/')
         self.screenshot_dir = screenshot_dir or Path("output/terakoya_screenshots")
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
@@ -113,6 +121,9 @@ class TerakoyaClient:
 
         if self.use_ai_extraction:
             try:
+                # Imported lazily: the anthropic SDK is slow to import and
+                # only needed when AI extraction is enabled
+                from ...utils.ai_extractor import AIExtractor
                 self.ai_extractor = AIExtractor()
                 logger.info("AI extraction enabled")
             except Exception as e:
@@ -1104,7 +1115,7 @@ class TerakoyaClient:
                 return
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"modal_{tag}_{timestamp}.html"
+            filename = f"modal_{tag}_{timestamp}_{uuid.uuid4().hex[:8]}.html"
             filepath = self.debug_dir / filename
             filepath.write_text(source_result.value, encoding="utf-8")
             logger.info(f"Saved modal HTML snapshot: {filepath}")
@@ -1228,6 +1239,9 @@ class TerakoyaClient:
         """
         Save a screenshot with timestamp.
 
+        A short random suffix keeps names unique when several clients
+        (parallel workers) fail within the same second.
+
         Args:
             name: Base name for screenshot
 
@@ -1235,7 +1249,7 @@ class TerakoyaClient:
             Result[bool] indicating success
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{name}_{timestamp}.png"
+        filename = f"{name}_{timestamp}_{uuid.uuid4().hex[:8]}.png"
         filepath = self.screenshot_dir / filename
 
         return self.browser.screenshot(str(filepath))
@@ -1872,15 +1886,16 @@ class TerakoyaClient:
 
             # Fill in form fields
             auto_date_mode = self._category_uses_auto_date(lesson.get("category", ""))
-            print(f"[DATE MODE] category='{lesson.get('category')}', auto_date_mode={auto_date_mode}")
+            logger.debug(
+                f"[DATE MODE] category='{lesson.get('category')}', auto_date_mode={auto_date_mode}"
+            )
 
             if auto_date_mode:
-                print(f"[DATE MODE] Skipping manual date input (auto-date category)")
                 logger.info(
                     "Skipping manual date input because dedicated lesson selection populates the date"
                 )
             else:
-                print(f"[DATE MODE] Manual date input required for: {lesson.get('category')}")
+                logger.debug(f"[DATE MODE] Manual date input required for: {lesson.get('category')}")
                 # Date (REQUIRED) - React DatePicker input
                 # Primary strategy dispatches React-compatible events via JavaScript
                 # Convert date format from YYYY-MM-DD to YYYY年MM月DD日
@@ -1921,11 +1936,9 @@ class TerakoyaClient:
                 time.sleep(0.2)
 
                 # Clear existing date value before setting new date (React DatePicker対応)
-                print(f"[DATE CLEAR] Target date to set: {date_formatted}")
                 logger.debug(f"Clearing existing date value before setting: {date_formatted}")
                 try:
                     current_value = date_element.get_attribute('value')
-                    print(f"[DATE CLEAR] Current value BEFORE clear: '{current_value}'")
                     logger.debug(f"Current date value: {current_value}")
 
                     # React DatePickerの内部状態もクリアするため、空文字列を設定してイベントをディスパッチ
@@ -1939,13 +1952,11 @@ class TerakoyaClient:
 
                     # クリア後の値を確認
                     cleared_value = date_element.get_attribute('value')
-                    print(f"[DATE CLEAR] Value AFTER clear: '{cleared_value}'")
+                    logger.debug(f"Date value after clear: '{cleared_value}'")
                 except Exception as clear_error:
-                    print(f"[DATE CLEAR ERROR] {clear_error}")
                     logger.warning(f"Failed to clear date field: {clear_error}")
 
                 # Primary approach: use JavaScript value setter compatible with React inputs
-                print(f"[DATE SET] Setting date via JavaScript: {date_formatted}")
                 logger.info(f"Setting date via JavaScript dispatcher: {date_formatted}")
                 set_date_result = self.browser.set_value_javascript(
                     By.CSS_SELECTOR,
@@ -1957,13 +1968,12 @@ class TerakoyaClient:
                 # 設定後の値を確認
                 try:
                     final_value = date_element.get_attribute('value')
-                    print(f"[DATE SET] Value AFTER set: '{final_value}'")
                     if final_value == date_formatted:
-                        print(f"[DATE SET SUCCESS] ✓ Date correctly set to: {date_formatted}")
+                        logger.debug(f"Date correctly set to: {date_formatted}")
                     else:
-                        print(f"[DATE SET WARNING] ✗ Expected '{date_formatted}' but got '{final_value}'")
+                        logger.warning(f"Date value mismatch: expected '{date_formatted}' but got '{final_value}'")
                 except Exception as check_error:
-                    print(f"[DATE SET CHECK ERROR] {check_error}")
+                    logger.debug(f"Failed to read back date value: {check_error}")
 
                 if set_date_result.is_failure:
                     logger.warning(
@@ -2263,27 +2273,29 @@ class TerakoyaClient:
             else:
                 # Normal mode: Click save button to submit
                 logger.info("Normal mode: Saving invoice item")
-                save_result = self.browser.click(
-                    By.XPATH,
-                    self.selectors.invoice.modal_save_button,
-                    timeout=5
-                )
-                if save_result.is_failure:
-                    self._save_screenshot("modal_save_failed")
-                    return Result.failure("Failed to click save button", save_result.error)
+                with self.save_lock or nullcontext():
+                    save_result = self.browser.click(
+                        By.XPATH,
+                        self.selectors.invoice.modal_save_button,
+                        timeout=5
+                    )
+                    if save_result.is_failure:
+                        self._save_screenshot("modal_save_failed")
+                        return Result.failure("Failed to click save button", save_result.error)
 
-                # Wait for modal to close
-                close_wait_result = self._wait_for_modal_closed(timeout=5)
-                if close_wait_result.is_failure:
-                    logger.warning(f"Modal close wait failed: {close_wait_result.message}")
+                    # Wait for modal to close (the save has been processed)
+                    close_wait_result = self._wait_for_modal_closed(timeout=5)
+                    if close_wait_result.is_failure:
+                        logger.warning(f"Modal close wait failed: {close_wait_result.message}")
 
                 logger.info("Invoice item saved successfully")
                 result = Result.success(None, "Invoice item saved")
 
                 # Auto-add "専属レッスン前後対応" for "専属レッスン" (normal mode)
-                print(f"[AUTO-ADD CHECK] category='{lesson.get('category')}', auto_add_support={auto_add_support}")
+                logger.debug(
+                    f"[AUTO-ADD CHECK] category='{lesson.get('category')}', auto_add_support={auto_add_support}"
+                )
                 if lesson.get("category") == "専属レッスン" and auto_add_support:
-                    print(f"[AUTO-ADD] 専属レッスン detected - will add 専属レッスン前後対応 for {lesson['date']}")
                     logger.info("専属レッスン detected - auto-adding 専属レッスン前後対応")
                     support_lesson: LessonData = {
                         "id": f"{lesson['id']}_support",
@@ -2294,7 +2306,10 @@ class TerakoyaClient:
                         "duration": 30,
                         "category": "専属レッスン前後対応"
                     }
-                    print(f"[AUTO-ADD] Support lesson data: date={support_lesson['date']}, student={support_lesson['student_name']}, duration={support_lesson['duration']}min")
+                    logger.debug(
+                        f"Support lesson data: date={support_lesson['date']}, "
+                        f"student={support_lesson['student_name']}, duration={support_lesson['duration']}min"
+                    )
                     # Recursively add support lesson (with auto_add_support=False to prevent infinite loop)
                     support_result = self.add_invoice_item(
                         support_lesson,
@@ -2303,10 +2318,8 @@ class TerakoyaClient:
                         auto_add_support=False
                     )
                     if support_result.is_success:
-                        print(f"[AUTO-ADD SUCCESS] ✓ 専属レッスン前後対応 added for {lesson['date']}")
                         logger.info(f"✓ 専属レッスン前後対応 auto-added for {lesson['date']}")
                     else:
-                        print(f"[AUTO-ADD FAILED] ✗ Failed: {support_result.message}")
                         logger.warning(f"Failed to auto-add 専属レッスン前後対応: {support_result.message}")
 
                 return result
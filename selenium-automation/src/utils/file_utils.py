@@ -5,13 +5,16 @@ This module provides utilities for saving and loading data files
 in various formats (JSON, CSV).
 """
 
+import csv
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 logger = logging.getLogger(__name__)
@@ -84,7 +87,7 @@ def load_json(filepath: Path) -> Optional[Dict[str, Any]]:
         return None
 
 
-def save_csv(df: pd.DataFrame, filepath: Path) -> bool:
+def save_csv(df: "pd.DataFrame", filepath: Path) -> bool:
     """
     Save DataFrame to CSV file.
 
@@ -115,7 +118,49 @@ def save_csv(df: pd.DataFrame, filepath: Path) -> bool:
         return False
 
 
-def load_csv(filepath: Path) -> Optional[pd.DataFrame]:
+def save_records_csv(records: List[Dict[str, Any]], filepath: Path) -> bool:
+    """
+    Save a list of dictionaries to CSV file.
+
+    Columns are the union of record keys in first-seen order, matching
+    pd.DataFrame(records).to_csv(index=False) without importing pandas.
+
+    Args:
+        records: Rows to save
+        filepath: Path to save the CSV file
+
+    Returns:
+        True if save successful, False otherwise
+
+    Examples:
+        >>> save_records_csv([{"col1": 1, "col2": 3}], Path("output/test.csv"))
+        True
+    """
+    try:
+        # Ensure parent directory exists
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        fieldnames = list(dict.fromkeys(key for record in records for key in record))
+
+        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(
+                f,
+                fieldnames=fieldnames,
+                restval="",
+                lineterminator=os.linesep
+            )
+            writer.writeheader()
+            writer.writerows(records)
+
+        logger.debug(f"Saved CSV file: {filepath}")
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to save CSV file {filepath}: {e}", exc_info=True)
+        return False
+
+
+def load_csv(filepath: Path) -> Optional["pd.DataFrame"]:
     """
     Load DataFrame from CSV file.
 
@@ -130,6 +175,9 @@ def load_csv(filepath: Path) -> Optional[pd.DataFrame]:
         >>> if df is not None:
         ...     print(df.head())
     """
+    # Imported lazily: pandas adds ~100ms to CLI startup
+    import pandas as pd
+
     try:
         if not filepath.exists():
             logger.warning(f"CSV file not found: {filepath}")
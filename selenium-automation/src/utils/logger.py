@@ -131,7 +131,7 @@ def setup_logger(
 
     # Define log format
     formatter = logging.Formatter(
-        fmt='%(asctime)s [%(levelname)s] %(name)s:%(funcName)s:%(lineno)d %(message)s',
+        fmt='%(asctime)s [%(levelname)s] [%(threadName)s] %(name)s:%(funcName)s:%(lineno)d %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
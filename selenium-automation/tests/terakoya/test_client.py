@@ -274,3 +274,11 @@ class TestTerakoyaClient:
         call_args = mock_browser.screenshot.call_args[0][0]
         assert "test_" in call_args
         assert call_args.endswith(".png")
+
+    def test_save_screenshot_names_unique(self, client, mock_browser):
+        """Test that screenshots taken in the same second get distinct names."""
+        client._save_screenshot("test")
+        client._save_screenshot("test")
+
+        first, second = [call[0][0] for call in mock_browser.screenshot.call_args_list]
+        assert first != second
@@ -0,0 +1,544 @@
+"""
+Unit tests for Browser helpers that do not need a running Chrome.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from src.automation.browser import Browser, _blocked_url_patterns, _build_options
+from src.automation.browser_config import BrowserConfig
+
+
+class TestNormalizeLocator:
+    """Test suite for XPath-to-CSS locator normalization."""
+
+    @pytest.mark.parametrize("xpath, css", [
+        ("//div", "div"),
+        ("//*", "*"),
+        ("//*[@id='login']", '[id="login"]'),
+        ('//input[@id="email"]', 'input[id="email"]'),
+        ("//button[@class='btn primary']", 'button[class="btn primary"]'),
+        ("//input[@name='q']", 'input[name="q"]'),
+        ("//input[@type='checkbox'][@data-row='3']", 'input[type="checkbox"][data-row="3"]'),
+    ])
+    def test_simple_xpath_converted(self, xpath, css):
+        """Test that simple document-wide XPaths become CSS selectors."""
+        assert Browser._normalize_locator(By.XPATH, xpath) == (By.CSS_SELECTOR, css)
+
+    @pytest.mark.parametrize("xpath", [
+        "//div[2]",
+        "//div//span",
+        "//a[contains(@href, '/home')]",
+        "//*[@id='a' or @id='b']",
+        "//*[contains(@class, 'btn')]",
+        "//*[@id='a\"b']",
+        "/html/body",
+    ])
+    def test_complex_xpath_unchanged(self, xpath):
+        """Test that XPaths without an exact CSS equivalent are kept."""
+        assert Browser._normalize_locator(By.XPATH, xpath) == (By.XPATH, xpath)
+
+    def test_non_xpath_unchanged(self):
+        """Test that other locator strategies pass through."""
+        assert Browser._normalize_locator(By.ID, "//div") == (By.ID, "//div")
+
+
+class TestResolveDriverPath:
+    """Test suite for ChromeDriver path resolution."""
+
+    def test_config_path_wins(self, tmp_path, monkeypatch):
+        """Test that config.driver_path takes precedence over the environment."""
+        driver = tmp_path / "chromedriver"
+        driver.write_text("")
+        monkeypatch.setenv("CHROMEDRIVER_PATH", "/opt/other/chromedriver")
+
+        browser = Browser(config=BrowserConfig(driver_path=str(driver)))
+
+        assert browser._resolve_driver_path() == str(driver)
+
+    def test_environment_path(self, monkeypatch):
+        """Test that CHROMEDRIVER_PATH bypasses webdriver-manager."""
+        monkeypatch.setenv("CHROMEDRIVER_PATH", "/opt/chromedriver")
+
+        assert Browser()._resolve_driver_path() == "/opt/chromedriver"
+
+    def test_webdriver_manager_called_once(self, monkeypatch):
+        """Test that webdriver-manager is only consulted once per process."""
+        monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+        calls = []
+
+        class FakeManager:
+            def install(self):
+                calls.append(1)
+                return "/cache/chromedriver"
+
+        monkeypatch.setattr("src.automation.browser.ChromeDriverManager", FakeManager)
+        Browser.invalidate_driver_cache()
+
+        try:
+            assert Browser()._resolve_driver_path() == "/cache/chromedriver"
+            assert Browser()._resolve_driver_path() == "/cache/chromedriver"
+            assert len(calls) == 1
+        finally:
+            Browser.invalidate_driver_cache()
+
+
+class TestChromeOptions:
+    """Test suite for Chrome option derivation."""
+
+    def test_extra_args_appended(self):
+        """Test that extra switches follow the built-in ones."""
+        config = BrowserConfig(extra_chrome_args=("--lang=ja-JP",))
+
+        arguments = _build_options(config).arguments
+
+        assert arguments[-1] == "--lang=ja-JP"
+        assert "--no-first-run" in arguments
+        assert "--no-sandbox" not in arguments
+
+    def test_prefs_and_experimental_options(self, tmp_path):
+        """Test that prefs and automation switches reach the Options object."""
+        config = BrowserConfig(download_dir=str(tmp_path), disable_images=True)
+
+        experimental = _build_options(config).experimental_options
+
+        assert experimental["excludeSwitches"] == ["enable-automation"]
+        assert experimental["prefs"]["download.default_directory"] == str(tmp_path)
+        assert experimental["prefs"]["profile.managed_default_content_settings.images"] == 2
+
+    def test_blocked_url_presets(self):
+        """Test that block_css/block_fonts extend the custom patterns."""
+        config = BrowserConfig(
+            blocked_url_patterns=("*analytics*",),
+            block_css=True,
+            block_fonts=True
+        )
+
+        patterns = _blocked_url_patterns(config)
+
+        assert patterns[0] == "*analytics*"
+        assert "*.css" in patterns
+        assert "*.woff2" in patterns
+        assert _blocked_url_patterns(BrowserConfig()) == []
+
+
+class TestNavigate:
+    """Test suite for navigate() wait strategies."""
+
+    def _browser(self, **config_kwargs):
+        browser = Browser(config=BrowserConfig(poll_frequency=0.01, **config_kwargs))
+        browser._driver = Mock()
+        # Previous document, then the time origin of the newly loaded one
+        browser._driver.execute_script.side_effect = [[1.0, "about:blank"], 2.0]
+        return browser
+
+    def test_load_with_normal_strategy_needs_no_extra_call(self):
+        """Test that driver.get() already satisfies "load" under normal page loading."""
+        browser = self._browser()
+
+        assert browser.navigate("https://example.com").is_success
+        browser._driver.get.assert_called_once_with("https://example.com")
+        browser._driver.execute_async_script.assert_not_called()
+
+    def test_default_adds_no_wait_to_early_strategies(self):
+        """Test that eager/none page loading is not undone by a default wait."""
+        for page_load_strategy in ("eager", "none"):
+            browser = self._browser(page_load_strategy=page_load_strategy)
+
+            assert browser.navigate("https://example.com").is_success
+            browser._driver.execute_async_script.assert_not_called()
+
+    def test_load_with_none_strategy_waits_in_browser(self):
+        """Test that "load" waits for readyState when the driver returns early."""
+        browser = self._browser(page_load_strategy="none", wait_strategy="load")
+
+        assert browser.navigate("https://example.com").is_success
+        args = browser._driver.execute_async_script.call_args[0]
+        assert args[1:] == ("complete", 0)
+
+    def test_waits_for_new_document_before_ready_state(self):
+        """Test that the readyState wait never runs in the previous document."""
+        browser = self._browser(page_load_strategy="none", wait_strategy="load")
+        browser._driver.execute_script.side_effect = [
+            [1.0, "https://example.com/old"],
+            1.0,
+            WebDriverException("javascript error: document unloaded"),
+            2.0,
+        ]
+
+        assert browser.navigate("https://example.com/new").is_success
+        assert browser._driver.execute_script.call_count == 4
+        browser._driver.execute_async_script.assert_called_once()
+
+    def test_new_document_timeout_fails_navigation(self):
+        """Test that a document that never changes fails instead of passing early."""
+        browser = self._browser(page_load_strategy="eager", wait_strategy="networkidle", timeout=1)
+        browser._driver.execute_script.side_effect = lambda script: (
+            [1.0, "https://example.com/old"] if "document.URL" in script else 1.0
+        )
+
+        result = browser.navigate("https://example.com/new")
+
+        assert result.is_failure
+        assert "Page load timeout" in result.message
+        browser._driver.execute_async_script.assert_not_called()
+
+    def test_fragment_navigation_keeps_document(self):
+        """Test that a fragment-only navigation does not wait for a new document."""
+        browser = self._browser(page_load_strategy="none", wait_strategy="load")
+
+        assert browser.navigate("about:blank#top").is_success
+        assert browser._driver.execute_script.call_count == 1
+        browser._driver.execute_async_script.assert_called_once()
+
+    def test_normal_strategy_skips_document_check(self):
+        """Test that driver.get() under normal loading needs no identity check."""
+        browser = self._browser(wait_strategy="networkidle")
+
+        assert browser.navigate("https://example.com").is_success
+        browser._driver.execute_script.assert_not_called()
+
+    def test_networkidle_override(self):
+        """Test per-call networkidle strategy."""
+        browser = self._browser()
+
+        browser.navigate("https://example.com", wait_strategy="networkidle")
+
+        args = browser._driver.execute_async_script.call_args[0]
+        assert args[1] == "complete"
+        assert args[2] > 0
+
+    def test_wait_timeout_fails_navigation(self):
+        """Test that a timed-out wait is reported as a navigation failure."""
+        browser = self._browser(page_load_strategy="eager")
+        browser._driver.execute_async_script.side_effect = TimeoutException()
+
+        result = browser.navigate("https://example.com", wait_strategy="load")
+
+        assert result.is_failure
+        assert "Page load timeout" in result.message
+
+
+class TestFindElements:
+    """Test suite for find_elements min_count handling."""
+
+    def test_min_count_zero_returns_immediately(self):
+        """Test that min_count=0 returns an empty list without waiting."""
+        browser = Browser(config=BrowserConfig(timeout=30))
+        browser._driver = Mock()
+        browser._driver.find_elements.return_value = []
+
+        result = browser.find_elements(By.CSS_SELECTOR, ".row", min_count=0)
+
+        assert result.is_success
+        assert result.value == []
+        browser._driver.find_elements.assert_called_once_with(By.CSS_SELECTOR, ".row")
+
+    def test_min_count_waits_for_threshold(self):
+        """Test that the wait continues until enough elements match."""
+        browser = Browser(config=BrowserConfig(timeout=5, poll_frequency=0.01))
+        browser._driver = Mock()
+        browser._driver.find_elements.side_effect = [["a"], ["a", "b"], ["a", "b", "c"]]
+
+        result = browser.find_elements(By.CSS_SELECTOR, ".row", min_count=3)
+
+        assert result.is_success
+        assert result.value == ["a", "b", "c"]
+        assert browser._driver.find_elements.call_count == 3
+
+
+class TestScreenshot:
+    """Test suite for CDP-based screenshots."""
+
+    def test_png_capture_omits_quality(self, tmp_path):
+        """Test PNG capture parameters and that the decoded bytes are written."""
+        browser = Browser()
+        browser._driver = Mock()
+        browser._driver.execute_cdp_cmd.return_value = {"data": "aGVsbG8="}
+        target = tmp_path / "shots" / "page.png"
+
+        result = browser.screenshot(str(target))
+
+        assert result.is_success
+        assert target.read_bytes() == b"hello"
+        command, params = browser._driver.execute_cdp_cmd.call_args[0]
+        assert command == "Page.captureScreenshot"
+        assert params["format"] == "png"
+        assert "quality" not in params
+
+    def test_jpeg_capture_uses_quality(self):
+        """Test that lossy formats pass the configured quality."""
+        browser = Browser(config=BrowserConfig(screenshot_format="jpeg", screenshot_quality=60))
+        browser._driver = Mock()
+        browser._driver.execute_cdp_cmd.return_value = {"data": ""}
+
+        assert browser.screenshot_bytes().is_success
+        _, params = browser._driver.execute_cdp_cmd.call_args[0]
+        assert params["format"] == "jpeg"
+        assert params["quality"] == 60
+
+
+class TestWaitCache:
+    """Test suite for cached WebDriverWait instances."""
+
+    def test_wait_reused_per_timeout_and_poll(self):
+        """Test that waits are cached by (timeout, poll_frequency)."""
+        browser = Browser(config=BrowserConfig(poll_frequency=0.1))
+        browser._driver = Mock()
+
+        default_wait = browser._wait(5)
+
+        assert browser._wait(5) is default_wait
+        assert browser._wait(5, 0.1) is default_wait
+        assert browser._wait(5, 0.02) is not default_wait
+        assert browser._wait(5, 0.02)._poll == 0.02
+
+
+class TestSetValue:
+    """Test suite for the preloaded value-setter helper."""
+
+    def _browser(self):
+        browser = Browser()
+        browser._driver = Mock()
+        return browser
+
+    def test_helper_registered_on_first_use(self):
+        """Test that the helper is only injected once fast input is used."""
+        browser = self._browser()
+        element = Mock()
+
+        browser._set_value(element, "2025-01-01")
+        browser._set_value(element, "2025-01-02")
+
+        browser._driver.execute_cdp_cmd.assert_called_once()
+        command, params = browser._driver.execute_cdp_cmd.call_args[0]
+        assert command == "Page.addScriptToEvaluateOnNewDocument"
+        assert "enumerable: false" in params["source"]
+        assert "__setReactValue" not in params["source"]
+        # The current document predates the helper: full script first
+        first, second = browser._driver.execute_script.call_args_list
+        assert "descriptor.set.call" in first[0][0]
+        assert "helper(arguments[0]" in second[0][0]
+
+    def test_uses_preloaded_helper(self):
+        """Test that only the short helper call is sent when it is installed."""
+        browser = self._browser()
+        browser._set_value_helper_installed = True
+        browser._driver.execute_script.return_value = True
+        element = Mock()
+
+        browser._set_value(element, "2025-01-01")
+
+        browser._driver.execute_script.assert_called_once()
+        assert "helper(arguments[0]" in browser._driver.execute_script.call_args[0][0]
+
+    def test_falls_back_to_full_script(self):
+        """Test fallback when the page has no preloaded helper."""
+        browser = self._browser()
+        browser._set_value_helper_installed = True
+        browser._driver.execute_script.side_effect = [False, None]
+        element = Mock()
+
+        browser._set_value(element, "2025-01-01")
+
+        assert browser._driver.execute_script.call_count == 2
+        assert "descriptor.set.call" in browser._driver.execute_script.call_args[0][0]
+
+
+class TestConcurrentOperations:
+    """Test suite for gather/afind_element."""
+
+    def test_gather_preserves_order(self):
+        """Test that gather returns results in submission order."""
+        browser = Browser()
+
+        results = browser.gather(lambda: 1, lambda: 2, lambda: 3)
+
+        assert results == [1, 2, 3]
+        browser.close()
+        assert browser._executor is None
+
+    def test_afind_element(self):
+        """Test that afind_element delegates to find_element on the pool."""
+        browser = Browser()
+        browser.find_element = Mock(return_value="found")
+
+        result = asyncio.run(browser.afind_element(By.ID, "email", 3))
+
+        assert result == "found"
+        browser.find_element.assert_called_once_with(By.ID, "email", 3)
+        browser.close()
+
+
+class TestPersistedDriverPath:
+    """Test suite for ChromeDriver path persistence in cache_dir."""
+
+    def test_path_persisted_and_reused(self, tmp_path, monkeypatch):
+        """Test that a resolved path is written once and reused on later runs."""
+        monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+        driver = tmp_path / "chromedriver"
+        driver.write_text("")
+        cache_dir = tmp_path / "cache"
+        lookups = []
+
+        def fake_lookup():
+            lookups.append(1)
+            return str(driver)
+
+        monkeypatch.setattr("src.automation.browser._cached_chromedriver_path", fake_lookup)
+        config = BrowserConfig(cache_dir=str(cache_dir))
+
+        assert Browser(config=config)._resolve_driver_path() == str(driver)
+        assert (cache_dir / "chromedriver_path").read_text() == str(driver)
+        assert Browser(config=config)._resolve_driver_path() == str(driver)
+        assert len(lookups) == 1
+
+    def test_stale_record_ignored(self, tmp_path, monkeypatch):
+        """Test that a record pointing at a missing binary is refreshed."""
+        monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+        driver = tmp_path / "chromedriver"
+        driver.write_text("")
+        (tmp_path / "chromedriver_path").write_text("/gone/chromedriver")
+        monkeypatch.setattr(
+            "src.automation.browser._cached_chromedriver_path", lambda: str(driver)
+        )
+
+        browser = Browser(config=BrowserConfig(cache_dir=str(tmp_path)))
+
+        assert browser._resolve_driver_path() == str(driver)
+        assert (tmp_path / "chromedriver_path").read_text() == str(driver)
+
+
+class TestBatchOps:
+    """Test suite for batch_ops."""
+
+    def test_single_script_call(self):
+        """Test that all operations are sent in one execute_script call."""
+        browser = Browser()
+        browser._driver = Mock()
+        browser._driver.execute_script.return_value = {
+            "results": [None, None, "Welcome"], "failed": None
+        }
+
+        result = browser.batch_ops([
+            ("set_value", By.ID, "email", "user@example.com"),
+            ("click", By.XPATH, "//button[@type='submit']"),
+            ("get_text", By.CSS_SELECTOR, "h1"),
+        ])
+
+        assert result.is_success
+        assert result.value == [None, None, "Welcome"]
+        browser._driver.execute_script.assert_called_once()
+        payload = browser._driver.execute_script.call_args[0][1]
+        assert payload[0] == {
+            "kind": "set_value", "by": By.ID, "value": "email", "text": "user@example.com"
+        }
+        assert payload[1]["by"] == By.CSS_SELECTOR
+        assert payload[1]["value"] == 'button[type="submit"]'
+
+    def test_missing_element_fails(self):
+        """Test that the failing operation is reported."""
+        browser = Browser()
+        browser._driver = Mock()
+        browser._driver.execute_script.return_value = {"results": [None], "failed": 1}
+
+        result = browser.batch_ops([
+            ("click", By.ID, "open"),
+            ("click", By.ID, "missing"),
+        ])
+
+        assert result.is_failure
+        assert "operation 1" in result.message
+        assert "id=missing" in result.message
+
+    @pytest.mark.parametrize("op", [
+        ("hover", By.ID, "menu"),
+        ("set_value", By.ID, "email"),
+        ("click", By.LINK_TEXT, "Home"),
+        ("click", By.PARTIAL_LINK_TEXT, "Ho"),
+    ])
+    def test_invalid_operation_rejected(self, op):
+        """Test that malformed operations raise before anything runs."""
+        browser = Browser()
+        browser._driver = Mock()
+
+        with pytest.raises(ValueError):
+            browser.batch_ops([op])
+
+        browser._driver.execute_script.assert_not_called()
+
+
+class TestInputText:
+    """Test suite for input_text."""
+
+    def _browser_with_element(self):
+        browser = Browser(config=BrowserConfig(timeout=1))
+        browser._driver = Mock()
+        element = Mock()
+        element.is_displayed.return_value = True
+        browser._driver.find_element.return_value = element
+        return browser, element
+
+    def test_overwrites_in_single_send_keys(self):
+        """Test that the value is replaced without a separate clear() call."""
+        browser, element = self._browser_with_element()
+
+        result = browser.input_text(By.ID, "email", "user@example.com")
+
+        assert result.is_success
+        element.clear.assert_not_called()
+        element.send_keys.assert_called_once()
+        keys = element.send_keys.call_args[0][0]
+        assert keys.endswith(Keys.NULL + "user@example.com")
+
+    @pytest.mark.parametrize("platform_name, modifier", [
+        ("mac", Keys.COMMAND),
+        ("linux", Keys.CONTROL),
+        ("windows", Keys.CONTROL),
+    ])
+    def test_select_all_uses_browser_platform(self, platform_name, modifier):
+        """Test that the select-all modifier follows the session's platformName."""
+        browser, element = self._browser_with_element()
+        browser._driver.capabilities = {"platformName": platform_name}
+
+        browser.input_text(By.ID, "email", "a")
+        browser.input_text(By.ID, "email", "b")
+
+        keys = element.send_keys.call_args_list[0][0][0]
+        assert keys == modifier + "a" + Keys.NULL + "a"
+
+    def test_empty_text_clears(self):
+        """Test that empty text clears the field."""
+        browser, element = self._browser_with_element()
+
+        assert browser.input_text(By.ID, "email", "").is_success
+        element.clear.assert_called_once()
+        element.send_keys.assert_not_called()
+
+
+class TestErrorHandling:
+    """Test suite for driver error handling."""
+
+    def test_driver_error_becomes_failure(self):
+        """Test that WebDriver errors are returned as failures."""
+        browser = Browser()
+        browser._driver = Mock()
+        browser._driver.execute_cdp_cmd.side_effect = WebDriverException("tab crashed")
+
+        result = browser.screenshot_bytes()
+
+        assert result.is_failure
+        assert isinstance(result.error, WebDriverException)
+
+    def test_unexpected_error_propagates(self):
+        """Test that non-WebDriver errors (bugs) are not swallowed."""
+        browser = Browser()
+        browser._driver = Mock()
+        browser._driver.execute_cdp_cmd.return_value = {}
+
+        with pytest.raises(KeyError):
+            browser.screenshot_bytes()
@@ -4,6 +4,7 @@ Unit tests for BrowserConfig.
 Tests browser configuration dataclass functionality.
 """
 
+import dataclasses
 import pytest
 from pathlib import Path
 from src.automation.browser_config import BrowserConfig
@@ -20,8 +21,24 @@ class TestBrowserConfig:
         assert config.download_dir is None
         assert config.window_size == (1920, 1080)
         assert config.timeout == 30
+        assert config.poll_frequency == 0.1
         assert config.disable_automation_flags is True
         assert config.user_agent is None
+        assert config.pool_size == 10
+        assert config.driver_path is None
+        assert config.disable_images is False
+        assert config.blocked_url_patterns == ()
+        assert config.block_css is False
+        assert config.block_fonts is False
+        assert config.extra_chrome_args == ()
+        assert config.page_load_strategy == "normal"
+        assert config.wait_strategy is None
+        assert config.container_mode is False
+        assert config.user_data_dir is None
+        assert config.cache_dir is None
+        assert config.screenshot_format == "png"
+        assert config.screenshot_quality == 80
+        assert config.reuse is False
 
     def test_custom_config(self):
         """Test custom configuration values."""
@@ -65,6 +82,7 @@ class TestBrowserConfig:
         assert config.download_dir == "/var/data/downloads"
         assert config.timeout == 60
         assert config.disable_automation_flags is True
+        assert config.disable_images is True
 
     def test_to_dict(self):
         """Test conversion to dictionary."""
@@ -80,6 +98,41 @@ class TestBrowserConfig:
         assert config_dict["window_size"] == (1920, 1080)
         assert config_dict["download_dir"] is None
 
+    def test_config_is_frozen(self):
+        """Test that configuration cannot be modified after creation."""
+        config = BrowserConfig()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.headless = True
+
+    def test_equal_configs_hash_equal(self):
+        """Test that list inputs are stored as tuples and configs are hashable."""
+        config = BrowserConfig(window_size=[1280, 720], blocked_url_patterns=["*.png"])
+
+        assert config.window_size == (1280, 720)
+        assert config.blocked_url_patterns == ("*.png",)
+        assert hash(config) == hash(
+            BrowserConfig(window_size=(1280, 720), blocked_url_patterns=("*.png",))
+        )
+
+    def test_chrome_args(self):
+        """Test derived Chrome switches."""
+        config = BrowserConfig(headless=True, window_size=(1280, 720))
+
+        assert "--headless=new" in config.chrome_args
+        assert "--window-size=1280,720" in config.chrome_args
+        assert config.chrome_args is BrowserConfig(headless=True, window_size=(1280, 720)).chrome_args
+
+    def test_chrome_prefs_returns_copy(self, tmp_path):
+        """Test that chrome_prefs can be modified without affecting the cache."""
+        config = BrowserConfig(download_dir=str(tmp_path))
+
+        prefs = config.chrome_prefs
+        prefs["extra"] = True
+
+        assert "extra" not in config.chrome_prefs
+        assert config.chrome_prefs["download.default_directory"] == str(tmp_path)
+
     def test_invalid_window_size_dimensions(self):
         """Test validation of window size dimensions."""
         with pytest.raises(ValueError, match="window_size must be a tuple"):
@@ -105,6 +158,74 @@ class TestBrowserConfig:
         with pytest.raises(ValueError, match="timeout must be positive"):
             BrowserConfig(timeout=-10)
 
+    def test_invalid_poll_frequency(self):
+        """Test validation of non-positive wait poll frequency."""
+        with pytest.raises(ValueError, match="poll_frequency must be positive"):
+            BrowserConfig(poll_frequency=0)
+
+    def test_invalid_pool_size(self):
+        """Test validation of non-positive connection pool size."""
+        with pytest.raises(ValueError, match="pool_size must be positive"):
+            BrowserConfig(pool_size=0)
+
+    def test_driver_path_missing(self, tmp_path):
+        """Test validation of a non-existent ChromeDriver path."""
+        with pytest.raises(ValueError, match="driver_path must be an existing file"):
+            BrowserConfig(driver_path=str(tmp_path / "chromedriver"))
+
+    def test_driver_path_valid_file(self, tmp_path):
+        """Test that an existing ChromeDriver path is accepted."""
+        driver = tmp_path / "chromedriver"
+        driver.write_text("")
+
+        config = BrowserConfig(driver_path=str(driver))
+        assert config.driver_path == str(driver)
+
+    def test_blocked_url_patterns_valid(self):
+        """Test that a tuple of URL patterns is accepted."""
+        config = BrowserConfig(blocked_url_patterns=("*.woff2", "*analytics*"))
+        assert config.blocked_url_patterns == ("*.woff2", "*analytics*")
+
+    def test_blocked_url_patterns_bare_string(self):
+        """Test validation when a single string is passed instead of a sequence."""
+        with pytest.raises(ValueError, match="blocked_url_patterns must be a sequence"):
+            BrowserConfig(blocked_url_patterns="*.woff2")
+
+    def test_blocked_url_patterns_empty_entry(self):
+        """Test validation of empty URL patterns."""
+        with pytest.raises(ValueError, match="blocked_url_patterns must be a sequence"):
+            BrowserConfig(blocked_url_patterns=("*.png", ""))
+
+    def test_extra_chrome_args_valid(self):
+        """Test that extra Chrome switches are accepted and stored as a tuple."""
+        config = BrowserConfig(extra_chrome_args=["--lang=ja-JP"])
+        assert config.extra_chrome_args == ("--lang=ja-JP",)
+
+    def test_extra_chrome_args_invalid(self):
+        """Test validation of extra Chrome switches."""
+        with pytest.raises(ValueError, match="extra_chrome_args must be a sequence"):
+            BrowserConfig(extra_chrome_args=("lang=ja-JP",))
+
+    def test_invalid_page_load_strategy(self):
+        """Test validation of unknown page load strategy."""
+        with pytest.raises(ValueError, match="page_load_strategy must be"):
+            BrowserConfig(page_load_strategy="fast")
+
+    def test_invalid_wait_strategy(self):
+        """Test validation of unknown navigation wait strategy."""
+        with pytest.raises(ValueError, match="wait_strategy must be"):
+            BrowserConfig(wait_strategy="idle")
+
+    def test_invalid_screenshot_format(self):
+        """Test validation of unsupported screenshot format."""
+        with pytest.raises(ValueError, match="screenshot_format must be"):
+            BrowserConfig(screenshot_format="gif")
+
+    def test_invalid_screenshot_quality(self):
+        """Test validation of out-of-range screenshot quality."""
+        with pytest.raises(ValueError, match="screenshot_quality must be between"):
+            BrowserConfig(screenshot_quality=101)
+
     def test_download_dir_not_directory(self, tmp_path):
         """Test validation when download_dir is a file, not directory."""
         # Create a file instead of directory
@@ -119,6 +240,29 @@ class TestBrowserConfig:
         config = BrowserConfig(download_dir=str(tmp_path))
         assert config.download_dir == str(tmp_path)
 
+    def test_user_data_dir_not_directory(self, tmp_path):
+        """Test validation when user_data_dir is a file, not directory."""
+        file_path = tmp_path / "profile.txt"
+        file_path.write_text("test")
+
+        with pytest.raises(ValueError, match="user_data_dir must be a directory"):
+            BrowserConfig(user_data_dir=str(file_path))
+
+    def test_cache_dir_not_directory(self, tmp_path):
+        """Test validation when cache_dir is a file, not directory."""
+        file_path = tmp_path / "cache.txt"
+        file_path.write_text("test")
+
+        with pytest.raises(ValueError, match="cache_dir must be a directory"):
+            BrowserConfig(cache_dir=str(file_path))
+
+    def test_user_data_dir_adds_profile_directory(self, tmp_path):
+        """Test that a persistent profile pins the Default profile directory."""
+        config = BrowserConfig(user_data_dir=str(tmp_path))
+
+        assert f"--user-data-dir={tmp_path}" in config.chrome_args
+        assert "--profile-directory=Default" in config.chrome_args
+
     def test_download_dir_nonexistent_allowed(self):
         """Test that non-existent directory is allowed (will be created)."""
         config = BrowserConfig(download_dir="/tmp/nonexistent_test_dir_12345")
@@ -0,0 +1,159 @@
+"""
+Unit tests for BrowserPool and Browser session reuse.
+"""
+
+from unittest.mock import Mock, PropertyMock
+
+from selenium.common.exceptions import WebDriverException
+
+from src.automation.browser import Browser
+from src.automation.browser_config import BrowserConfig
+from src.automation.browser_pool import BrowserPool, default_pool
+
+
+class TestBrowserPool:
+    """Test suite for BrowserPool."""
+
+    def test_acquire_empty_returns_none(self):
+        """Test that acquiring from an empty pool returns None."""
+        pool = BrowserPool()
+
+        assert pool.acquire(BrowserConfig()) is None
+
+    def test_release_then_acquire(self):
+        """Test that a released driver is handed out for an equal config."""
+        pool = BrowserPool()
+        driver = Mock()
+
+        pool.release(BrowserConfig(headless=True), driver)
+
+        assert pool.idle_count() == 1
+        assert pool.acquire(BrowserConfig(headless=True)) is driver
+        assert pool.idle_count() == 0
+
+    def test_configs_do_not_share_drivers(self):
+        """Test that drivers are only reused for an equal configuration."""
+        pool = BrowserPool()
+        pool.release(BrowserConfig(headless=True), Mock())
+
+        assert pool.acquire(BrowserConfig(headless=False)) is None
+        assert pool.idle_count(BrowserConfig(headless=True)) == 1
+
+    def test_most_recently_released_first(self):
+        """Test LIFO ordering of idle drivers."""
+        pool = BrowserPool()
+        config = BrowserConfig()
+        first, second = Mock(), Mock()
+
+        pool.release(config, first)
+        pool.release(config, second)
+
+        assert pool.acquire(config) is second
+        assert pool.acquire(config) is first
+
+    def test_dead_drivers_skipped(self):
+        """Test that drivers failing the liveness probe are quit and skipped."""
+        pool = BrowserPool()
+        config = BrowserConfig()
+        alive, dead = Mock(), Mock()
+        type(dead).current_url = PropertyMock(side_effect=WebDriverException("session deleted"))
+        dead.quit.side_effect = WebDriverException("already gone")
+
+        pool.release(config, alive)
+        pool.release(config, dead)
+
+        assert pool.acquire(config) is alive
+        dead.quit.assert_called_once()
+        assert pool.idle_count() == 0
+
+    def test_only_dead_drivers_returns_none(self):
+        """Test that a pool holding only dead drivers behaves as empty."""
+        pool = BrowserPool()
+        dead = Mock()
+        type(dead).current_url = PropertyMock(side_effect=WebDriverException("chrome not reachable"))
+
+        pool.release(BrowserConfig(), dead)
+
+        assert pool.acquire(BrowserConfig()) is None
+        dead.quit.assert_called_once()
+
+    def test_shutdown_all_quits_drivers(self):
+        """Test that shutdown quits every idle driver, even if one fails."""
+        pool = BrowserPool()
+        failing, healthy = Mock(), Mock()
+        failing.quit.side_effect = Exception("already dead")
+
+        pool.release(BrowserConfig(), failing)
+        pool.release(BrowserConfig(headless=True), healthy)
+        pool.shutdown_all()
+
+        failing.quit.assert_called_once()
+        healthy.quit.assert_called_once()
+        assert pool.idle_count() == 0
+
+
+class TestBrowserReuse:
+    """Test suite for Browser integration with the default pool."""
+
+    def teardown_method(self):
+        """Drop any drivers left in the shared pool."""
+        default_pool.shutdown_all()
+
+    def test_close_returns_driver_to_pool(self):
+        """Test that close() resets and pools the driver instead of quitting."""
+        config = BrowserConfig(reuse=True)
+        driver = Mock()
+        driver.window_handles = ["main"]
+
+        browser = Browser(config=config)
+        browser._driver = driver
+        browser.close()
+
+        driver.close.assert_not_called()
+        driver.execute_cdp_cmd.assert_called_once_with("Network.clearBrowserCookies", {})
+        driver.get.assert_called_once_with("about:blank")
+        driver.quit.assert_not_called()
+        assert Browser(config=config).driver is driver
+
+    def test_extra_windows_closed_before_pooling(self):
+        """Test that tabs opened by the previous user are closed on release."""
+        config = BrowserConfig(reuse=True)
+        driver = Mock()
+        driver.window_handles = ["main", "popup", "tab"]
+        switched = []
+        driver.switch_to.window.side_effect = switched.append
+
+        browser = Browser(config=config)
+        browser._driver = driver
+        browser.close()
+
+        assert switched == ["popup", "tab", "main"]
+        assert driver.close.call_count == 2
+        driver.get.assert_called_once_with("about:blank")
+        assert default_pool.idle_count(config) == 1
+
+    def test_failed_reset_quits_driver(self):
+        """Test that a driver that cannot be reset is quit, not pooled."""
+        config = BrowserConfig(reuse=True)
+        driver = Mock()
+        driver.window_handles = ["main"]
+        driver.get.side_effect = Exception("session lost")
+
+        browser = Browser(config=config)
+        browser._driver = driver
+        browser.close()
+
+        driver.quit.assert_called_once()
+        assert default_pool.idle_count(config) == 0
+
+    def test_close_without_reuse_quits(self):
+        """Test that close() quits the driver when reuse is off."""
+        driver = Mock()
+
+        browser = Browser()
+        browser._driver = driver
+        browser.close()
+        browser.close()
+
+        driver.quit.assert_called_once()
+        assert default_pool.idle_count() == 0
@@ -0,0 +1,308 @@
+"""
+Unit tests for Scraper.
+"""
+
+import pandas as pd
+import pytest
+
+from src.automation.scraper import LexborHTMLParser, Scraper
+
+
+PAGE = """
+<html><body>
+  <h1 class="page-title">Lessons</h1>
+  <div class="intro"><p>Weekly schedule</p></div>
+  <ul>
+    <li class="lesson"><span class="date">01-06</span><span class="name">Sato</span></li>
+    <li class="lesson"><span class="date">01-07</span></li>
+  </ul>
+  <a class="link" href="/lessons" data-new>Lessons</a>
+  <table class="data">
+    <tr><th>Date</th><th>Student</th></tr>
+    <tr><td>2025-01-06</td><td>Sato</td></tr>
+    <tr><td>2025-01-07</td><td>Suzuki</td></tr>
+  </table>
+  <table class="other">
+    <tr><th>Name</th></tr>
+    <tr><td>Tanaka</td></tr>
+  </table>
+</body></html>
+"""
+
+
+class TestTableParsing:
+    """Test suite for tag-restricted parsing of tables."""
+
+    def test_only_tags_skips_other_elements(self):
+        """Test that only_tags keeps just the requested subtrees."""
+        scraper = Scraper(PAGE, only_tags=["table"])
+
+        assert not scraper.has_element("h1")
+        assert len(scraper.extract_tables()) == 2
+
+    def test_tag_selector_avoids_full_parse(self):
+        """Test that a tag-only table selector does not parse the whole page."""
+        scraper = Scraper(PAGE)
+
+        df = scraper.extract_table("table.data")
+
+        assert df is not None
+        assert df.shape == (2, 2)
+        assert scraper._soup is None
+
+    def test_descendant_selector_uses_full_tree(self):
+        """Test that selectors depending on ancestors see the full page."""
+        scraper = Scraper(PAGE)
+
+        assert len(scraper.extract_tables("body > table")) == 2
+        assert scraper._soup is not None
+
+    def test_parsed_document_reused(self):
+        """Test that table extraction reuses an already parsed document."""
+        scraper = Scraper(PAGE)
+        assert scraper.get_text(".page-title") == "Lessons"
+
+        assert len(scraper.extract_tables()) == 2
+        assert scraper._tag_soups == {}
+
+
+class TestTableConversion:
+    """Test suite for building DataFrames from parsed tables."""
+
+    def test_rows_walked_directly(self):
+        """Test header, row order, whitespace and padding without read_html."""
+        html = """
+        <table>
+          <tfoot><tr><td>Total</td><td>2</td></tr></tfoot>
+          <thead><tr><th>Date</th><th></th></tr></thead>
+          <tbody>
+            <tr><td>01-06</td><td> Sato <b>Taro</b> </td></tr>
+            <tr><td>01-07</td></tr>
+          </tbody>
+        </table>
+        """
+
+        df = Scraper(html).extract_table()
+
+        assert list(df.columns) == ["Date", "Unnamed: 1"]
+        assert list(df["Date"]) == ["01-06", "01-07", "Total"]
+        assert df["Unnamed: 1"].isna().tolist() == [False, True, False]
+        assert df.loc[0, "Unnamed: 1"] == "Sato Taro"
+
+    def test_no_header_uses_positions(self):
+        """Test that headerless tables get integer column labels."""
+        df = Scraper("<table><tr><td>1</td><td>2</td></tr></table>").extract_table()
+
+        assert list(df.columns) == [0, 1]
+        assert df.values.tolist() == [["1", "2"]]
+
+    def test_tables_without_rows_skipped(self):
+        """Test that row-less tables are skipped like read_html does."""
+        html = """
+        <table class="empty"><caption>Nothing yet</caption></table>
+        <table class="hidden"><tr style="display:none"><td>x</td></tr></table>
+        <table class="header-only"><tr><th>A</th></tr></table>
+        <table class="data"><tr><td>1</td></tr></table>
+        """
+
+        assert Scraper(html).extract_table("table.empty") is None
+        assert Scraper(html).extract_table("table.hidden") is None
+        for tables in (Scraper(html).extract_tables("table[class]"), Scraper(html).extract_tables()):
+            assert [list(df.columns) for df in tables] == [["A"], [0]]
+            assert tables[0].empty
+
+    def test_spanning_cells_expanded_as_strings(self):
+        """Test read_html-style colspan/rowspan expansion without type inference."""
+        html = """
+        <table>
+          <tr><th>A</th><th>B</th></tr>
+          <tr><td colspan="2">1</td></tr>
+          <tr><td rowspan="2">007</td><td>2.50</td></tr>
+          <tr><td>3</td></tr>
+        </table>
+        """
+
+        df = Scraper(html).extract_table()
+
+        assert df.values.tolist() == [["1", "1"], ["007", "2.50"], ["007", "3"]]
+        assert all(isinstance(dtype, pd.StringDtype) for dtype in df.dtypes)
+
+    def test_same_dtype_for_plain_tables(self):
+        """Test that tables without spans get the same string dtype."""
+        df = Scraper("<table><tr><td>1</td><td></td></tr></table>").extract_table()
+
+        assert all(isinstance(dtype, pd.StringDtype) for dtype in df.dtypes)
+        assert df.isna().values.tolist() == [[False, True]]
+
+    def test_line_breaks_read_as_spaces(self):
+        """Test that <br> separates words like in read_html."""
+        html = "<table><tr><th>Name</th></tr><tr><td>Sato<br>Taro</td></tr></table>"
+
+        assert Scraper(html).extract_table()["Name"].tolist() == ["Sato Taro"]
+        assert next(Scraper(html).iter_tables())["Name"].tolist() == ["Sato Taro"]
+
+    def test_duplicate_headers_mangled(self):
+        """Test that repeated header labels become A, A.1, ..."""
+        html = "<table><tr><th>A</th><th>A</th><th>A</th></tr><tr><td>1</td><td>2</td><td>3</td></tr></table>"
+
+        assert list(Scraper(html).extract_table().columns) == ["A", "A.1", "A.2"]
+
+    def test_multi_row_header(self):
+        """Test that several header rows become a MultiIndex."""
+        html = """
+        <table>
+          <thead>
+            <tr><th colspan="2">Lesson</th></tr>
+            <tr><th>Date</th><th>Student</th></tr>
+          </thead>
+          <tr><td>01-06</td><td>Sato</td></tr>
+        </table>
+        """
+
+        df = Scraper(html).extract_table()
+
+        assert list(df.columns) == [("Lesson", "Date"), ("Lesson", "Student")]
+
+
+class TestIterTables:
+    """Test suite for streamed table extraction."""
+
+    def test_streams_all_tables(self):
+        """Test that every table is yielded without building the soup."""
+        scraper = Scraper(PAGE)
+
+        tables = list(scraper.iter_tables())
+
+        assert [df.shape for df in tables] == [(2, 2), (1, 1)]
+        assert list(tables[0]["Student"]) == ["Sato", "Suzuki"]
+        assert scraper._soup is None
+
+    def test_nested_tables_in_document_order(self):
+        """Test that streamed order matches the parsed-document order."""
+        html = """
+        <table><tr><td>outer<table><tr><td>inner</td></tr></table></td></tr></table>
+        <p>between</p>
+        <table><tr><td>last</td></tr></table>
+        """
+
+        streamed = Scraper(html).extract_tables()
+        parsed = Scraper(html)
+        parsed.get_text()
+        from_soup = parsed.extract_tables()
+
+        assert [df.shape for df in streamed] == [(1, 1), (1, 1), (1, 1)]
+        first, *rest = [df.iloc[0, 0] for df in streamed]
+        assert first.startswith("outer")
+        assert rest == ["inner", "last"]
+        assert [df.iloc[0, 0] for df in from_soup] == [df.iloc[0, 0] for df in streamed]
+
+    def test_default_extract_tables_streams(self):
+        """Test that extract_tables() uses the streaming path when nothing is parsed."""
+        scraper = Scraper(PAGE)
+
+        assert len(scraper.extract_tables()) == 2
+        assert scraper._soup is None
+        assert scraper._tag_soups == {}
+
+
+PARSERS = [
+    "lxml",
+    pytest.param(
+        "selectolax",
+        marks=pytest.mark.skipif(LexborHTMLParser is None, reason="selectolax not installed")
+    ),
+]
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+class TestLookups:
+    """Test suite for text/attribute lookups on each parser backend."""
+
+    def test_text(self, parser):
+        """Test single and multiple text lookups."""
+        scraper = Scraper(PAGE, parser=parser)
+
+        assert scraper.get_text(".intro") == "Weekly schedule"
+        assert scraper.get_text(".missing") == ""
+        assert scraper.find_element_text(".missing", "none") == "none"
+        assert scraper.find_elements_text("li .date") == ["01-06", "01-07"]
+
+    def test_text_skips_script_and_style(self, parser):
+        """Test that script/style contents are not page text on any backend."""
+        html = """
+        <html><head><title>T</title><style>.a{color:red}</style>
+        <script>var x = 1;</script></head>
+        <body><p>Hello <b>World</b></p><div>Tail<script>track()</script></div></body></html>
+        """
+        scraper = Scraper(html, parser=parser)
+        reference = Scraper(html)
+
+        assert scraper.get_text() == reference.get_text() == "T Hello World Tail"
+        assert scraper.get_text("div") == reference.get_text("div") == "Tail"
+        # Skipping them must not remove them from the parsed document
+        assert scraper.get_text("div > script") == "track()"
+
+    def test_attributes(self, parser):
+        """Test attribute lookup including valueless attributes."""
+        scraper = Scraper(PAGE, parser=parser)
+
+        assert scraper.get_attribute("a.link", "href") == "/lessons"
+        assert scraper.get_attribute("a.link", "data-new") == ""
+        assert scraper.get_attribute("a.link", "title", "n/a") == "n/a"
+        assert scraper.has_element("a.link")
+        assert not scraper.has_element("a.missing")
+
+    def test_structured_data(self, parser):
+        """Test per-item field extraction with missing fields."""
+        scraper = Scraper(PAGE, parser=parser)
+
+        lessons = scraper.extract_structured_data(
+            "li.lesson", {"date": ".date", "name": ".name"}
+        )
+
+        assert lessons == [
+            {"date": "01-06", "name": "Sato"},
+            {"date": "01-07", "name": None},
+        ]
+
+    def test_structured_data_df(self, parser):
+        """Test column-wise extraction into string columns."""
+        scraper = Scraper(PAGE, parser=parser)
+
+        df = scraper.extract_structured_data_df(
+            "li.lesson", {"date": ".date", "name": ".name"}
+        )
+
+        assert list(df.columns) == ["date", "name"]
+        assert list(df["date"]) == ["01-06", "01-07"]
+        assert df["name"].isna().tolist() == [False, True]
+        assert all(isinstance(dtype, pd.StringDtype) for dtype in df.dtypes)
+
+    def test_structured_data_df_no_items(self, parser):
+        """Test that no matching items gives an empty frame with the field columns."""
+        scraper = Scraper(PAGE, parser=parser)
+
+        df = scraper.extract_structured_data_df(".missing", {"date": ".date"})
+
+        assert df.empty
+        assert list(df.columns) == ["date"]
+
+    def test_nested_items_exclude_self(self, parser):
+        """Test that field lookups only search below the item."""
+        html = '<div class="box"><div class="box">inner</div></div>'
+        scraper = Scraper(html, parser=parser)
+
+        data = scraper.extract_structured_data("div.box", {"child": ".box"})
+
+        assert data == [{"child": "inner"}, {"child": None}]
+
+
+class TestParserSelection:
+    """Test suite for parser backend selection."""
+
+    def test_missing_selectolax(self, monkeypatch):
+        """Test that requesting selectolax without it installed fails clearly."""
+        monkeypatch.setattr("src.automation.scraper.LexborHTMLParser", None)
+
+        with pytest.raises(ImportError):
+            Scraper(PAGE, parser="selectolax")